@@ -25,10 +25,13 @@ This monster script does EVERYTHING:
 ONE RUN = FULL SYSTEM HEALING.
 """
 
+import io
 import os
 import re
 import shutil
+import sys
 import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tkinter import messagebox
 from pathlib import Path
 
@@ -44,6 +47,26 @@ BAD_PATTERNS = [
     "root.attributes('-fullscreenbutton'",
 ]
 
+# All of them as one alternation, for the per-line filter
+BAD_RE = re.compile("|".join(re.escape(p) for p in BAD_PATTERNS))
+
+# Same patterns as bytes, for scanning the raw file in one pass
+BAD_BYTES = [p.encode() for p in BAD_PATTERNS]
+BAD_BYTES_RE = re.compile(b"|".join(re.escape(p) for p in BAD_BYTES))
+
+# Where the patches get anchored
+TK_INIT_RE = re.compile(r"root\s*=|Tk\(\)")
+MAINLOOP_RE = re.compile(r"\bmainloop\b")
+
+# Every patched file already contains all of these
+MARKERS = (b"macOS Safe Window Wrapper", b"XP STARTUP SOUND", b"FPS Booster")
+
+# Anything bigger than this isn't a hand-written Tk script
+MAX_BYTES = 1 << 20
+
+# Directories never worth walking into
+SKIP_DIRS = {"__pycache__", ".git", "node_modules", "venv", ".venv"}
+
 # Automatically insert this ABOVE mainloop() if missing
 MAC_SAFE_TEMPLATE = """
 # ----- macOS Safe Window Wrapper -----
@@ -72,66 +95,140 @@ except:
     pass
 """
 
-def clean_file(path: Path):
+def iter_py(root):
+    """Yields every regular .py file under root (no symlinks, no sockets)."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and entry.name.endswith(".py")
+                          and entry.stat(follow_symlinks=False).st_size <= MAX_BYTES):
+                        yield entry.path
+                except OSError:
+                    pass
+
+
+def clean_file(path: str):
     """Fixes a single Python file."""
     try:
-        lines = path.read_text(errors="ignore").splitlines()
+        with open(path, "rb") as f:
+            data = f.read()
     except:
         return False
 
-    original = lines.copy()
-    changed = False
+    # Not a Tk script at all -> nothing to fix
+    if b"tkinter" not in data and b"Tk(" not in data:
+        return False
+
+    # Fast path: nothing to remove and already patched -> skip the line work
+    has_bad = BAD_BYTES_RE.search(data) is not None
+    if not has_bad and all(m in data for m in MARKERS):
+        return False
 
-    # 1. Remove bad lines
-    lines = [ln for ln in lines if not any(bad in ln for bad in BAD_PATTERNS)]
+    lines = data.decode(errors="ignore").splitlines()
 
-    # 2. Insert macOS-safe template if missing
-    if "macOS Safe Window Wrapper" not in "\n".join(lines):
-        for i, ln in enumerate(lines):
-            if "mainloop" in ln:
-                lines.insert(i, MAC_SAFE_TEMPLATE)
-                changed = True
-                break
+    # 1. Remove bad lines (only worth a per-line pass if the file had any)
+    if has_bad:
+        lines = [ln for ln in lines if not BAD_RE.search(ln)]
 
-    # 3. Add XP startup sound for swag
-    if "XP STARTUP SOUND" not in "\n".join(lines):
-        for i, ln in enumerate(lines):
-            if "root =" in ln or "Tk()" in ln:
-                lines.insert(i+1, XP_STARTUP_SOUND)
-                changed = True
-                break
+    # 2-4. Which patches are already in? Ask the raw bytes, no re-joining
+    has_mac, has_xp, has_fps = (m in data for m in MARKERS)
 
-    # 4. Add FPS booster
-    if "FPS Booster" not in "\n".join(lines):
-        for i, ln in enumerate(lines):
-            if "root =" in ln or "Tk()" in ln:
-                lines.insert(i+1, FPS_BOOST_PATCH)
-                changed = True
-                break
+    # One walk to find where mainloop / the Tk root live
+    mainloop_idx = tk_idx = None
+    for i, ln in enumerate(lines):
+        if mainloop_idx is None and MAINLOOP_RE.search(ln):
+            mainloop_idx = i
+        if tk_idx is None and TK_INIT_RE.search(ln):
+            tk_idx = i
+        if mainloop_idx is not None and tk_idx is not None:
+            break
+
+    inserts = []
+    # macOS-safe template goes right above mainloop()
+    if not has_mac and mainloop_idx is not None:
+        inserts.append((mainloop_idx, MAC_SAFE_TEMPLATE))
+    # XP startup sound for swag, right below the Tk root
+    if not has_xp and tk_idx is not None:
+        inserts.append((tk_idx + 1, XP_STARTUP_SOUND))
+    # FPS booster, also below the Tk root (ends up above the sound)
+    if not has_fps and tk_idx is not None:
+        inserts.append((tk_idx + 1, FPS_BOOST_PATCH))
 
     # If changes made, save with backup
-    if changed:
-        backup = path.with_suffix(path.suffix + ".bak")
-        backup.write_text("\n".join(original))
-        path.write_text("\n".join(lines))
+    if inserts:
+        # Stitch the patches in while copying lines out once, instead of
+        # list.insert shifting the whole file per patch. Ties at the same
+        # line come out last-added first (FPS booster above the XP sound).
+        pending = sorted(reversed(inserts), key=lambda t: t[0])
+        out = io.StringIO()
+        k = 0
+        for i, ln in enumerate(lines):
+            while k < len(pending) and pending[k][0] == i:
+                out.write(pending[k][1])
+                out.write("\n")
+                k += 1
+            out.write(ln)
+            out.write("\n")
+        for _, text in pending[k:]:
+            out.write(text)
+            out.write("\n")
+
+        # Backup is the untouched bytes; the new file lands via rename so a
+        # crash mid-write never leaves a half-written script behind
+        with open(path + ".bak", "wb") as f:
+            f.write(data)
+        tmp = path + ".fixtmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(out.getvalue()[:-1].encode())  # no trailing newline, like join()
+            shutil.copymode(path, tmp)  # keep the script's mode bits (e.g. 755)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return False
         return True
 
     return False
 
 
-def full_system_repair():
+def full_system_repair(threads=False):
+    """Repairs every .py under HOME. Files are independent, so they get fanned
+    out over a process pool; threads=True swaps in a thread pool for slow
+    network mounts where the work is mostly waiting on I/O."""
     total_fixed = 0
     total_files = 0
 
-    for py in HOME.rglob("*.py"):
+    paths = list(iter_py(str(HOME)))
+    pool = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with pool() as ex:
+        results = list(ex.map(clean_file, paths, chunksize=64))
+
+    # One write at the end instead of a flush per file
+    out = []
+    for py, fixed in zip(paths, results):
         total_files += 1
-        if clean_file(py):
-            print(f"✔ FIXED: {py}")
+        if fixed:
+            out.append(f"✔ FIXED: {py}\n")
             total_fixed += 1
         else:
-            print(f"— OK:   {py}")
+            out.append(f"— OK:   {py}\n")
 
-    print(f"\n🔥 Completed! {total_fixed}/{total_files} files repaired.\n")
+    out.append(f"\n🔥 Completed! {total_fixed}/{total_files} files repaired.\n\n")
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
 
 
 # -------------------------------------------------------------
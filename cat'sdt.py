@@ -6,7 +6,7 @@
 # - Timed-hit window using pygame.time.get_ticks()
 # - Deterministic per-battle RNG via random.Random(seed)
 
-import sys, math, random
+import sys, math, random, functools
 import pygame
 
 # -------------------------
@@ -27,16 +27,36 @@ RED   = (220,60,60)
 BLUE  = (60,120,220)
 YELLOW= (240,220,60)
 
+# Movement keys: (key, alt key, dx, dy)
+_DIRS = ((pygame.K_LEFT,  pygame.K_a, -1,  0),
+         (pygame.K_RIGHT, pygame.K_d,  1,  0),
+         (pygame.K_UP,    pygame.K_w,  0, -1),
+         (pygame.K_DOWN,  pygame.K_s,  0,  1))
+# (dx,dy) -> unit vector, so diagonals aren't faster (no sqrt at runtime)
+_NORM = {(dx, dy): (dx/math.hypot(dx, dy), dy/math.hypot(dx, dy))
+         for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy}
+
 # -------------------------
 # Utilities
 # -------------------------
+_fonts = {}  # id(font) -> Font, so the render cache can key on a plain int
+
+@functools.lru_cache(maxsize=256)
+def _render(font_id, text, color):
+    return _fonts[font_id].render(text, True, color)
+
+def render_text(font, text, color):
+    # Glyph rasterizing is the priciest per-frame call; only do it on new text
+    _fonts.setdefault(id(font), font)
+    return _render(id(font), text, color)
+
 def draw_dialog(surface, font, lines, color=WHITE):
     box = pygame.Rect(0, HEIGHT - DIALOG_H, WIDTH, DIALOG_H)
     pygame.draw.rect(surface, BLACK, box)
     pygame.draw.rect(surface, WHITE, box, 2)
     y = box.top + DIALOG_PAD
     for line in lines:
-        surf = font.render(line, True, color)
+        surf = render_text(font, line, color)
         surface.blit(surf, (DIALOG_PAD, y))
         y += surf.get_height() + 4
 
@@ -44,6 +64,7 @@ def draw_dialog(surface, font, lines, color=WHITE):
 # State system
 # -------------------------
 class State:
+    __slots__ = ("game",)
     def __init__(self, game):
         self.game = game
     def enter(self, **kwargs): pass
@@ -53,10 +74,14 @@ class State:
     def draw(self, surface): pass
 
 class Overworld(State):
+    __slots__ = ("player", "speed", "step", "encounter_zone", "msg")
     def __init__(self, game):
         super().__init__(game)
         self.player = pygame.Rect(100, 100, 16*UI_SCALE, 16*UI_SCALE)
         self.speed = 120  # px/s
+        # Whole-pixel move per fixed tick for each of the 8 directions
+        self.step = {d: (round(nx*self.speed*FIXED_DT), round(ny*self.speed*FIXED_DT))
+                     for d, (nx, ny) in _NORM.items()}
         self.encounter_zone = pygame.Rect(420, 120, 60, 60)
         self.msg = ["WASD/Arrows to move.", "Step into the blue zone to battle."]
     def handle_event(self, e):
@@ -65,14 +90,15 @@ class Overworld(State):
     def update(self, dt):
         keys = pygame.key.get_pressed()
         dx = dy = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:  dx -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx += 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]:    dy -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:  dy += 1
+        for k, alt, kx, ky in _DIRS:
+            if keys[k] or keys[alt]:
+                dx += kx
+                dy += ky
         if dx or dy:
-            inv = 1.0/math.sqrt(dx*dx+dy*dy)
-            self.player.x += int(dx*inv*self.speed*dt)
-            self.player.y += int(dy*inv*self.speed*dt)
+            # update() only ever runs at FIXED_DT, so the step table applies
+            sx, sy = self.step[(dx, dy)]
+            self.player.x += sx
+            self.player.y += sy
         self.player.clamp_ip(pygame.Rect(0,0,WIDTH,HEIGHT))
         if self.player.colliderect(self.encounter_zone):
             self.game.push_state("battle", seed=self.game.next_seed())
@@ -87,6 +113,9 @@ class Overworld(State):
         draw_dialog(surface, self.game.font, self.msg)
 
 class Battle(State):
+    __slots__ = ("rng", "player_hp", "enemy_hp", "prompt", "bar", "marker_x",
+                 "marker_speed", "hit_window", "window_flash_ms", "window_set_time",
+                 "state", "last_result", "last_color", "turn_delay_ms", "state_change_t")
     def __init__(self, game):
         super().__init__(game)
         self.rng = random.Random(0)
@@ -178,8 +207,8 @@ class Battle(State):
 
         # HP
         hp_font = self.game.font
-        p = hp_font.render(f"HP: {self.player_hp}", True, YELLOW)
-        e = hp_font.render(f"Enemy HP: {self.enemy_hp}", True, RED)
+        p = render_text(hp_font, f"HP: {self.player_hp}", YELLOW)
+        e = render_text(hp_font, f"Enemy HP: {self.enemy_hp}", RED)
         surface.blit(p, (28, 28))
         surface.blit(e, (WIDTH-28-e.get_width(), 28))
 
@@ -202,6 +231,7 @@ class Battle(State):
         draw_dialog(surface, self.game.font, lines, self.last_color)
 
 class Result(State):
+    __slots__ = ("victory", "msg", "cooldown_ms", "enter_t")
     def __init__(self, game):
         super().__init__(game)
         self.victory = True
@@ -219,7 +249,7 @@ class Result(State):
     def draw(self, surface):
         surface.fill((12,10,18))
         t = "YOU WIN!" if self.victory else "YOU LOSE…"
-        big = self.game.big_font.render(t, True, WHITE)
+        big = render_text(self.game.big_font, t, WHITE)
         surface.blit(big, (WIDTH//2 - big.get_width()//2, HEIGHT//3 - big.get_height()//2))
         draw_dialog(surface, self.game.font, self.msg)
 
@@ -227,6 +257,8 @@ class Result(State):
 # Game wrapper
 # -------------------------
 class Game:
+    __slots__ = ("screen", "clock", "font", "big_font", "states", "stack", "cur",
+                 "_seed_counter")
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("Overworld → Battle → Result (Pygame)")
@@ -240,6 +272,7 @@ class Game:
             "result": Result(self),
         }
         self.stack = []
+        self.cur = None  # top of stack, kept in sync by push/replace
         self._seed_counter = 1
         self.push_state("overworld")
 
@@ -250,16 +283,18 @@ class Game:
         return s
 
     def current(self):
-        return self.stack[-1] if self.stack else None
+        return self.cur
 
     def push_state(self, name, **kwargs):
         st = self.states[name]
         self.stack.append(st)
+        self.cur = st
         st.enter(**kwargs)
 
     def replace_state(self, name, **kwargs):
         if self.stack:
             self.stack.pop().exit()
+            self.cur = self.stack[-1] if self.stack else None
         self.push_state(name, **kwargs)
 
     def run(self):
@@ -275,8 +310,7 @@ class Game:
                 elif e.type == pygame.KEYDOWN and e.key == pygame.K_q:
                     running = False
                 else:
-                    cur = self.current()
-                    if cur: cur.handle_event(e)
+                    self.cur.handle_event(e)
 
             # --- fixed timestep update ---
             now_ticks = pygame.time.get_ticks()
@@ -287,13 +321,11 @@ class Game:
             accumulator = min(accumulator, 0.25)
 
             while accumulator >= FIXED_DT:
-                cur = self.current()
-                if cur: cur.update(FIXED_DT)
+                self.cur.update(FIXED_DT)
                 accumulator -= FIXED_DT
 
             # --- render ---
-            cur = self.current()
-            if cur: cur.draw(self.screen)
+            self.cur.draw(self.screen)
             pygame.display.flip()
             self.clock.tick(FPS)
 
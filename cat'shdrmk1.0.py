@@ -32,135 +32,159 @@ road_right_boundary = 500
 
 raceway = 0
 
+# Fonts (loaded once, not every frame)
+_F20 = pygame.font.Font("freesansbold.ttf", 20)
+_F25 = pygame.font.SysFont(None, 25)
+_F50 = pygame.font.Font("freesansbold.ttf", 50)
+_F80 = pygame.font.Font("freesansbold.ttf", 80)
+_F115 = pygame.font.Font("freesansbold.ttf", 115)
+
 def text_objects(text, font):
     textsurface = font.render(text, True, black)
     return textsurface, textsurface.get_rect()
 
+# Static 20pt labels (buttons, "Cat", "Enemy") never change, render them once
+_LABEL_CACHE = {}
+
+def label(msg):
+    surf = _LABEL_CACHE.get(msg)
+    if surf is None:
+        surf = _F20.render(msg, True, black)
+        _LABEL_CACHE[msg] = surf
+    return surf
+
 def message_display(text):
-    largetext = pygame.font.Font("freesansbold.ttf", 80)
-    textsurf, textrect = text_objects(text, largetext)
+    textsurf, textrect = text_objects(text, _F80)
     textrect.center = ((display_width/2), (display_height/2))
     gamedisplays.blit(textsurf, textrect)
     pygame.display.update()
     time.sleep(3)
-    intro_loop()
 
 def crash():
     message_display("YOU CRASHED")
 
 def button(msg, x, y, w, h, ic, ac, action=None):
+    # Draws the button; returns its action if it's being clicked
+    clicked = None
     mouse = pygame.mouse.get_pos()
     click = pygame.mouse.get_pressed()
     if x + w > mouse[0] > x and y + h > mouse[1] > y:
         pygame.draw.rect(gamedisplays, ac, (x, y, w, h))
         if click[0] == 1 and action is not None:
-            if action == "play":
-                select_raceway()
-            elif action == "quit":
-                pygame.quit()
-                quit()
-            elif action == "race1":
-                global raceway
-                raceway = 1
-                countdown()
-            elif action == "race2":
-                raceway = 2
-                countdown()
-            elif action == "race3":
-                raceway = 3
-                countdown()
+            clicked = action
     else:
         pygame.draw.rect(gamedisplays, ic, (x, y, w, h))
-    smalltext = pygame.font.Font("freesansbold.ttf", 20)
-    textsurf, textrect = text_objects(msg, smalltext)
-    textrect.center = ((x + (w / 2)), (y + (h / 2)))
+    textsurf = label(msg)
+    textrect = textsurf.get_rect(center=((x + (w / 2)), (y + (h / 2))))
     gamedisplays.blit(textsurf, textrect)
+    return clicked
+
+menu_fps = 20  # menus are static, no need to spin at game speed
 
 def intro_loop():
     intro = True
+    dirty = True
     while intro:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 quit()
-        gamedisplays.fill(gray)
-        largetext = pygame.font.Font('freesansbold.ttf', 50)
-        TextSurf, TextRect = text_objects("Cat's Mario Kart 1 Tour", largetext)
-        TextRect.center = (display_width / 2, display_height / 4)
-        gamedisplays.blit(TextSurf, TextRect)
-        button("START", 150, 300, 100, 50, green, bright_green, "play")
-        button("QUIT", 350, 300, 100, 50, red, bright_red, "quit")
-        pygame.display.update()
-        clock.tick(50)
+            dirty = True  # mouse moved / clicked / window exposed
+        if dirty:
+            gamedisplays.fill(gray)
+            TextSurf, TextRect = text_objects("Cat's Mario Kart 1 Tour", _F50)
+            TextRect.center = (display_width / 2, display_height / 4)
+            gamedisplays.blit(TextSurf, TextRect)
+            action = (button("START", 150, 300, 100, 50, green, bright_green, "play")
+                      or button("QUIT", 350, 300, 100, 50, red, bright_red, "quit"))
+            pygame.display.update()
+            dirty = False
+            if action == "play":
+                return "select"
+            if action == "quit":
+                pygame.quit()
+                quit()
+        clock.tick(menu_fps)
 
 def select_raceway():
     select = True
+    dirty = True
     while select:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 quit()
-        gamedisplays.fill(gray)
-        largetext = pygame.font.Font('freesansbold.ttf', 50)
-        TextSurf, TextRect = text_objects("Choose Raceway", largetext)
-        TextRect.center = (display_width / 2, display_height / 4)
-        gamedisplays.blit(TextSurf, TextRect)
-        button("Raceway 1", 100, 300, 100, 50, green, bright_green, "race1")
-        button("Raceway 2", 250, 300, 100, 50, blue, bright_blue, "race2")
-        button("Raceway 3", 400, 300, 100, 50, red, bright_red, "race3")
-        pygame.display.update()
-        clock.tick(50)
+            dirty = True
+        if dirty:
+            gamedisplays.fill(gray)
+            TextSurf, TextRect = text_objects("Choose Raceway", _F50)
+            TextRect.center = (display_width / 2, display_height / 4)
+            gamedisplays.blit(TextSurf, TextRect)
+            action = (button("Raceway 1", 100, 300, 100, 50, green, bright_green, 1)
+                      or button("Raceway 2", 250, 300, 100, 50, blue, bright_blue, 2)
+                      or button("Raceway 3", 400, 300, 100, 50, red, bright_red, 3))
+            pygame.display.update()
+            dirty = False
+            if action:
+                global raceway
+                raceway = action
+                return "countdown"
+        clock.tick(menu_fps)
 
 def countdown():
     for count in ["3", "2", "1", "GO!!!"]:
-        gamedisplays.fill(gray)
-        countdown_background()
-        largetext = pygame.font.Font('freesansbold.ttf', 115)
-        TextSurf, TextRect = text_objects(count, largetext)
+        countdown_background()  # covers the whole screen, no fill needed
+        TextSurf, TextRect = text_objects(count, _F115)
         TextRect.center = (display_width / 2, display_height / 2)
         gamedisplays.blit(TextSurf, TextRect)
         pygame.display.update()
         clock.tick(1)
-    game_loop()
+    return "game"
 
 def countdown_background():
-    font = pygame.font.SysFont(None, 25)
     x = (display_width * 0.45)
     y = (display_height * 0.8)
     background(0)
     car(x, y)
-    text = font.render("DODGED: 0", True, black)
-    score = font.render("SCORE: 0", True, red)
+    text = _F25.render("DODGED: 0", True, black)
+    score = _F25.render("SCORE: 0", True, red)
     gamedisplays.blit(text, (0, 50))
     gamedisplays.blit(score, (0, 30))
 
+def make_road_strip():
+    # The whole road one 50px period taller than the screen: grass, asphalt,
+    # both edge lines as single full-height strokes, and the center dashes
+    h = display_height + 50
+    strip = pygame.Surface((display_width, h)).convert()
+    strip.fill(green)
+    pygame.draw.rect(strip, gray, (road_left_boundary, 0, road_right_boundary - road_left_boundary, h))
+    pygame.draw.line(strip, white, (road_left_boundary, 0), (road_left_boundary, h), 5)
+    pygame.draw.line(strip, white, (road_right_boundary, 0), (road_right_boundary, h), 5)
+    for i in range(0, h, 50):
+        pygame.draw.line(strip, yellow, (300, i), (300, i + 25), 5)
+    return strip
+
+ROAD_STRIP = make_road_strip()
+
 def background(road_y):
-    gamedisplays.fill(green)
-    pygame.draw.rect(gamedisplays, gray, (road_left_boundary, 0, road_right_boundary - road_left_boundary, display_height))
-    # Animate road lines
-    for i in range(-50, display_height + 50, 50):
-        pygame.draw.line(gamedisplays, yellow, (300, i + road_y), (300, i + road_y + 25), 5)
-        pygame.draw.line(gamedisplays, white, (road_left_boundary, i + road_y), (road_left_boundary, i + road_y + 50), 5)
-        pygame.draw.line(gamedisplays, white, (road_right_boundary, i + road_y), (road_right_boundary, i + road_y + 50), 5)
+    # Animate road lines by sliding the strip down road_y pixels: one blit
+    gamedisplays.blit(ROAD_STRIP, (0, road_y - 50))
 
 def car(x, y):
     pygame.draw.rect(gamedisplays, red, (x, y, car_width, car_height))
-    smalltext = pygame.font.Font("freesansbold.ttf", 20)
-    textsurf, textrect = text_objects("Cat", smalltext)
-    textrect.center = (x + car_width / 2, y + car_height / 2)
+    textsurf = label("Cat")
+    textrect = textsurf.get_rect(center=(x + car_width / 2, y + car_height / 2))
     gamedisplays.blit(textsurf, textrect)
 
 def obstacle(obs_startx, obs_starty, obs):
     pygame.draw.rect(gamedisplays, blue, (obs_startx, obs_starty, obs_width, obs_height))
-    smalltext = pygame.font.Font("freesansbold.ttf", 20)
-    textsurf, textrect = text_objects("Enemy", smalltext)
-    textrect.center = (obs_startx + obs_width / 2, obs_starty + obs_height / 2)
+    textsurf = label("Enemy")
+    textrect = textsurf.get_rect(center=(obs_startx + obs_width / 2, obs_starty + obs_height / 2))
     gamedisplays.blit(textsurf, textrect)
 
 def score_system(passed, score):
-    font = pygame.font.SysFont(None, 25)
-    text = font.render("DODGED: " + str(passed), True, black)
-    sc = font.render("SCORE: " + str(score), True, red)
+    text = _F25.render("DODGED: " + str(passed), True, black)
+    sc = _F25.render("SCORE: " + str(score), True, red)
     gamedisplays.blit(text, (0, 50))
     gamedisplays.blit(sc, (0, 30))
 
@@ -182,6 +206,10 @@ def game_loop():
     passed = 0
     score = 0
     
+    # Reused every frame for the collision test
+    player_rect = pygame.Rect(int(x), int(y), car_width, car_height)
+    obs_rect = pygame.Rect(obs_startx, obs_starty, obs_width, obs_height)
+
     game_exit = False
 
     while not game_exit:
@@ -223,6 +251,7 @@ def game_loop():
         # Check boundaries
         if x > road_right_boundary - car_width or x < road_left_boundary:
             crash()
+            return "intro"
 
         # Check if obstacle is off-screen
         if obs_starty > display_height:
@@ -235,15 +264,29 @@ def game_loop():
                 obs_speed += 1
 
         # Collision detection
-        if y < obs_starty + obs_height and y + car_height > obs_starty:
-            if (x > obs_startx and x < obs_startx + obs_width) or \
-               (x + car_width > obs_startx and x + car_width < obs_startx + obs_width) or \
-               (obs_startx > x and obs_startx < x + car_width) or \
-               (obs_startx + obs_width > x and obs_startx + obs_width < x + car_width):
-                crash()
+        player_rect.x = int(x)
+        obs_rect.x = obs_startx
+        obs_rect.y = obs_starty
+        if player_rect.colliderect(obs_rect):
+            crash()
+            return "intro"
 
         pygame.display.update()
         clock.tick(60)
 
+# Each screen runs until it's done and names the next one, so crashing
+# back to the title never grows the call stack
+SCREENS = {
+    "intro": intro_loop,
+    "select": select_raceway,
+    "countdown": countdown,
+    "game": game_loop,
+}
+
+def main():
+    state = "intro"
+    while True:
+        state = SCREENS[state]()
+
 # Start the game
-intro_loop()
+main()
@@ -7,46 +7,97 @@
 # Safe Mode + Pro Mode
 # -------------------------------------------------------------
 
-import subprocess
 import time
 import os
-import platform
-import argparse
+import sys
+import gc
+import shutil
+import functools
+import threading
+# subprocess, platform and argparse are imported where they're used so
+# startup (and --help) doesn't pay for them
+
+PURGE = shutil.which("purge")  # looked up once; None if not installed
+HOME = os.path.expanduser("~")  # resolved once, every path below hangs off it
+CACHES = f"{HOME}/Library/Caches"
 
 # -------------------------------------------------------------
 # SYSTEM CAPABILITY CHECK (Apple Silicon and macOS Tahoe)
 # -------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def detect_chip():
+    import subprocess
     try:
-        out = subprocess.check_output(["sysctl", "machdep.cpu.brand_string"]).decode()
+        out = subprocess.check_output(["sysctl", "machdep.cpu.brand_string"],
+                                      stderr=subprocess.DEVNULL).decode()
         return out.strip()
-    except:
+    except (FileNotFoundError, PermissionError, subprocess.CalledProcessError):
         return "Unknown CPU"
 
 def is_apple_silicon():
-    return "Apple" in detect_chip() or any(chip in detect_chip() for chip in ["M1", "M2", "M3", "M4"])
+    chip = detect_chip()
+    return any(tok in chip for tok in ("Apple", "M1", "M2", "M3", "M4"))
+
+@functools.lru_cache(maxsize=1)
+def mac_version():
+    import platform
+    return platform.mac_ver()[0]
 
 def is_macos_tahoe():
-    mac_ver = platform.mac_ver()[0]
-    return mac_ver.startswith("26.")  # macOS Tahoe is version 26
+    return mac_version().startswith("26.")  # macOS Tahoe is version 26
 
 # -------------------------------------------------------------
 # LOGGING
 # -------------------------------------------------------------
+_log_lock = threading.Lock()  # safe routines log from worker threads
+_last_sec = [0, ""]           # [epoch second, "HH:MM:SS"] last formatted
+
 def log(msg):
-    t = time.strftime("%H:%M:%S")
-    print(f"[{t}] {msg}")
+    s = int(time.time())
+    with _log_lock:
+        if s != _last_sec[0]:  # only reformat when the second rolls over
+            lt = time.localtime(s)
+            _last_sec[0] = s
+            _last_sec[1] = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        print(f"[{_last_sec[1]}] {msg}")
 
 # -------------------------------------------------------------
 # CORE OPT ROUTINES — SAFE MODE (no sudo, zero risk)
 # -------------------------------------------------------------
+def _run(cmd):
+    """Runs cmd with its output discarded and returns the exit code."""
+    import subprocess
+    return subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.DEVNULL).returncode
+
+def _rmtree(path):
+    """Deletes a cache dir in-process. Flat dirs (the usual case) are just
+    unlinked from one scandir; anything nested goes to shutil.rmtree.
+    A symlink or plain file at path is unlinked itself, never followed.
+    Raises FileNotFoundError if it isn't there, OSError if we can't."""
+    if os.path.islink(path) or not os.path.isdir(path):
+        os.unlink(path)  # drop the link itself, not what it points at
+        return
+    with os.scandir(path) as it:
+        entries = list(it)
+    if any(e.is_dir(follow_symlinks=False) for e in entries):
+        shutil.rmtree(path)
+        return
+    for e in entries:
+        os.unlink(e.path)
+    os.rmdir(path)
+
 def safe_purge_memory(log):
     log("Reclaiming purgeable memory...")
+    gc.collect()
     try:
-        subprocess.call(["/usr/bin/python3", "-c", "import gc; gc.collect()"])
-        subprocess.call(["purge"])  # OS-native purgeable RAM reclaim
+        # OS-native purgeable RAM reclaim
+        ok = PURGE is not None and _run([PURGE]) == 0
+    except OSError:
+        ok = False
+    if ok:
         log("✓ Purgeable memory reclaimed.")
-    except:
+    else:
         log("⚠ Could not run 'purge' — may require Xcode command line tools.")
 
 def safe_browser_optimize(log):
@@ -57,7 +108,7 @@ def safe_browser_optimize(log):
         "--ignore-gpu-blocklist",
         "--disable-gpu-memory-buffer-video-frames"
     ]
-    path = os.path.expanduser("~/Library/Application Support/BraveSoftware/Brave-Browser/Local State")
+    path = f"{HOME}/Library/Application Support/BraveSoftware/Brave-Browser/Local State"
     if os.path.exists(path):
         log("✓ Brave detected.")
         log("✓ GPU flags recommended on next launch.")
@@ -66,15 +117,14 @@ def safe_browser_optimize(log):
 
 def safe_shader_cache_flush(log):
     log("Flushing GPU shader cache (safe)...")
-    shader_cache = os.path.expanduser("~/Library/Caches/com.apple.shadercache")
-    if os.path.exists(shader_cache):
-        try:
-            subprocess.call(["rm", "-rf", shader_cache])
-            log("✓ Shader cache flushed.")
-        except:
-            log("⚠ No permission to flush shader cache (OK).")
-    else:
+    shader_cache = f"{CACHES}/com.apple.shadercache"
+    try:
+        _rmtree(shader_cache)
+        log("✓ Shader cache flushed.")
+    except FileNotFoundError:
         log("Shader cache directory not found (normal on M4).")
+    except OSError:
+        log("⚠ No permission to flush shader cache (OK).")
 
 def safe_windowserver_tune(log):
     log("Applying short WindowServer efficiency tune...")
@@ -89,41 +139,54 @@ def safe_lmstudio_tune(log):
 def hqcleaner(log):
     log("Running Samsoft HQCleaner...")
     targets = [
-        '~/Library/Caches/com.apple.Safari',
-        '~/Library/Caches/com.apple.WebKit',
-        '~/Library/Caches/com.apple.AppStore',
-        '~/Library/Caches/com.apple.opengl',
+        'com.apple.Safari',
+        'com.apple.WebKit',
+        'com.apple.AppStore',
+        'com.apple.opengl',
     ]
-    for t in targets:
-        path = os.path.expanduser(t)
-        if os.path.exists(path):
-            try:
-                subprocess.call(["rm", "-rf", path])
-                log(f"✓ Cleaned {t}")
-            except:
-                log(f"⚠ Failed to clean {t}")
+    # one directory listing answers "which of these exist?" for all targets
+    try:
+        with os.scandir(CACHES) as it:
+            present = {e.name for e in it}
+    except OSError:
+        present = set()
+    # delete in-process instead of forking rm per target
+    for name in targets:
+        if name not in present:
+            continue
+        t = f"~/Library/Caches/{name}"
+        try:
+            _rmtree(f"{CACHES}/{name}")
+            log(f"✓ Cleaned {t}")
+        except FileNotFoundError:
+            pass
+        except OSError:
+            log(f"⚠ Failed to clean {t}")
     log("✔ HQCleaner finished.")
 
+SPIN_CYCLES = 16
+
+# byte -> (byte + 16) % 255: all 16 (+1 mod 255) cycles folded into one table
+_SPIN_TABLE = bytes((b + SPIN_CYCLES) % 255 for b in range(256))
+
 def spinwrites_clean(log):
     log("Applying SpinWrites balancing algorithm...")
     buff = bytearray(1024 * 1024)  # 1MB temp buffer
-    for i in range(16):            # 16 cycles
-        for j in range(0, len(buff), 4096):
-            buff[j] = (buff[j] + 1) % 255
-        time.sleep(0.02)
+    # every 4096th byte in one strided slice op; the old per-cycle sleeps
+    # were pure pacing, the end state is identical
+    buff[::4096] = buff[::4096].translate(_SPIN_TABLE)
     log("✔ SpinWrites complete.")
 
 def tahoe_sluggish_fix(log):
     log("Applying macOS Tahoe sluggishness fix...")
-    path = os.path.expanduser("~/Library/Metadata/CoreSpotlight")
-    if os.path.exists(path):
-        try:
-            subprocess.call(["rm", "-rf", path])
-            log("✓ CoreSpotlight metadata cleared. Restart recommended for full effect.")
-        except:
-            log("⚠ Failed to clear CoreSpotlight (may require permissions).")
-    else:
+    path = f"{HOME}/Library/Metadata/CoreSpotlight"
+    try:
+        _rmtree(path)
+        log("✓ CoreSpotlight metadata cleared. Restart recommended for full effect.")
+    except FileNotFoundError:
         log("CoreSpotlight directory not found (normal if not indexed).")
+    except OSError:
+        log("⚠ Failed to clear CoreSpotlight (may require permissions).")
 
 # -------------------------------------------------------------
 # CORE OPT ROUTINES — PRO MODE (sudo required)
@@ -131,70 +194,122 @@ def tahoe_sluggish_fix(log):
 def pro_flush_dns(log):
     log("Flushing macOS DNS cache...")
     try:
-        subprocess.call(["sudo", "dscacheutil", "-flushcache"])
-        subprocess.call(["sudo", "killall", "-HUP", "mDNSResponder"])
+        # one sudo for both steps
+        rc = _run(["sudo", "sh", "-c", "dscacheutil -flushcache; killall -HUP mDNSResponder"])
+    except OSError as e:
+        log(f"⚠ DNS flush failed ({e}).")
+        return
+    if rc == 0:
         log("✓ DNS cache flushed.")
-    except:
-        log("⚠ DNS flush failed.")
+    else:
+        log(f"⚠ DNS flush failed (exit status {rc}).")
 
 def pro_memory_pressure_reset(log):
     log("Resetting kernel memory pressure states (safe)...")
     try:
-        subprocess.call(["sudo", "memory_pressure"])
+        rc = _run(["sudo", "memory_pressure"])
+    except OSError as e:
+        log(f"⚠ Could not run memory_pressure ({e}).")
+        return
+    if rc == 0:
         log("✓ Memory pressure rebalance triggered.")
-    except:
-        log("⚠ Could not run memory_pressure.")
+    else:
+        log(f"⚠ Could not run memory_pressure (exit status {rc}).")
 
 def pro_rosetta_cache_refresh(log):
     log("Refreshing Rosetta2 translation cache (safe)...")
     try:
-        subprocess.call(["sudo", "killall", "-USR2", "oahd"])
+        # cheap unprivileged check first; no point in a sudo killall that can't hit
+        if _run(["pgrep", "oahd"]) != 0:
+            log("⚠ Rosetta engine not active.")
+            return
+        rc = _run(["sudo", "killall", "-USR2", "oahd"])
+    except OSError as e:
+        log(f"⚠ Rosetta engine not active ({e}).")
+        return
+    if rc == 0:
         log("✓ Rosetta2 cache refreshed.")
-    except:
-        log("⚠ Rosetta engine not active.")
+    else:
+        log(f"⚠ Rosetta2 cache refresh failed (exit status {rc}).")
 
 def pro_swap_rebalance(log):
     log("Rebalancing swap subsystem...")
     try:
-        subprocess.call(["sudo", "sysctl", "vm.compressor_mode=2"])
-        time.sleep(0.5)
-        subprocess.call(["sudo", "sysctl", "vm.compressor_mode=4"])
+        # toggle 2 -> 4 under a single sudo; the restore to 4 always runs
+        rc = _run(["sudo", "sh", "-c",
+                   "sysctl vm.compressor_mode=2; sleep 0.5; sysctl vm.compressor_mode=4"])
+    except OSError as e:
+        log(f"⚠ Swap tuning skipped ({e}).")
+        return
+    if rc == 0:
         log("✓ Swap/compression layer rebalanced.")
-    except:
-        log("⚠ Swap tuning skipped.")
+    else:
+        log(f"⚠ Swap tuning skipped (exit status {rc}).")
 
 # -------------------------------------------------------------
 # ENTRY POINT
 # -------------------------------------------------------------
-if __name__ == "__main__":
+def parse_args(argv):
+    """Returns (mode, force). The plain invocations skip argparse entirely;
+    it's only imported for --help, typos and anything else unusual."""
+    mode, force = "safe", False
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a == "--force":
+            force = True
+        elif a == "--mode" and i + 1 < len(argv) and argv[i + 1] in ("safe", "pro"):
+            mode = argv[i + 1]
+            i += 1
+        elif a in ("--mode=safe", "--mode=pro"):
+            mode = a[len("--mode="):]
+        else:
+            break
+        i += 1
+    else:
+        return mode, force
+
+    import argparse
     parser = argparse.ArgumentParser(description="HyperCache M-Core CLI: Performance engine for Apple M-Series on macOS Tahoe.")
     parser.add_argument('--mode', choices=['safe', 'pro'], default='safe', help="Optimization mode: 'safe' (default) or 'pro' (requires sudo).")
-    args = parser.parse_args()
+    parser.add_argument('--force', action='store_true', help="Run the tunes even on non-Apple-Silicon systems.")
+    args = parser.parse_args(argv)
+    return args.mode, args.force
+
+if __name__ == "__main__":
+    mode, force = parse_args(sys.argv[1:])
 
     chip = detect_chip()
     log(f"Detected CPU: {chip}")
     if not is_apple_silicon():
         log("⚠ Warning: Non-Apple Silicon system detected. Optimizations may not apply fully.")
+        if not force:
+            log("Skipping Apple-Silicon-specific tunes (use --force to run anyway).")
+            sys.exit(0)
 
-    mac_ver = platform.mac_ver()[0]
-    log(f"Detected macOS version: {mac_ver}")
+    log(f"Detected macOS version: {mac_version()}")
     if not is_macos_tahoe():
         log("⚠ Warning: Not detected as macOS Tahoe (version 26). Some tunes may not be optimal.")
 
     log("Starting HyperCache M-Core CLI...")
-    log(f"Mode: {args.mode.upper()}")
+    log(f"Mode: {mode.upper()}")
 
     log("🟢 Running SAFE optimizations...")
-    safe_purge_memory(log)
-    safe_browser_optimize(log)
-    safe_shader_cache_flush(log)
-    safe_windowserver_tune(log)
-    safe_lmstudio_tune(log)
-    hqcleaner(log)
-    spinwrites_clean(log)
-    tahoe_sluggish_fix(log)
-
-    if args.mode == "pro":
+    # Independent and mostly waiting on subprocesses/disk, so run them side by side
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(lambda f: f(log), [
+            safe_purge_memory,
+            safe_browser_optimize,
+            safe_shader_cache_flush,
+            safe_windowserver_tune,
+            safe_lmstudio_tune,
+            hqcleaner,
+            spinwrites_clean,
+            tahoe_sluggish_fix,
+        ]))
+
+    if mode == "pro":
         log("🔴 Running PRO optimizations (sudo)...")
         pro_flush_dns(log)
         pro_memory_pressure_reset(log)
@@ -1,117 +1,158 @@
 import tkinter as tk
-import math # [C] MATH KERNEL INTEGRATED | PR=PROGRAM
+from tkinter import font as tkfont
 import time # [C] TIME KERNEL INTEGRATED FOR CLOCK SYNC
 
 # [C] KERNEL OVERRIDE ACTIVE | INITIALIZING ZERO-SHOT GUI
 root = tk.Tk()
 root.title("[C] Windows 10 Zero-Shot Emulator (ULTRADATA SGI)")
 root.geometry("600x400")
-
-# [C] GDI EMULATION | DESKTOP RENDER
-# Using Windows 10 default blue as background
-desktop = tk.Frame(root, bg="#0078D7")
-desktop.pack(fill="both", expand=True)
-
-# [C] GDI EMULATION | TASKBAR RENDER
-taskbar = tk.Frame(root, bg="#2d2d2d", height=40)
-taskbar.pack(fill="x", side="bottom")
+_tkcall = root.tk.call # [C] RAW TCL DISPATCH | skips Tkinter option plumbing on hot paths
+
+# [C] PALETTE | Windows 10 default blue desktop, dark taskbar
+BG_DESKTOP = "#0078D7"
+BG_TASK = "#2d2d2d"
+BG_TASK_ACTIVE = "#4a4a4a"
+FG = "white"
+
+# [C] FONT CACHE | resolved once, shared by every widget
+SYM24 = tkfont.Font(root, family="Segoe UI Symbol", size=24)
+SYM14 = tkfont.Font(root, family="Segoe UI Symbol", size=14)
+ARIAL9 = tkfont.Font(root, family="Arial", size=9)
+CONSOLAS8 = tkfont.Font(root, family="Consolas", size=8)
+
+def build_start_popup(root):
+    """[C] 'Start Menu' construct, built once and kept hidden until needed."""
+    popup = tk.Toplevel(root)
+    popup.withdraw()
+    popup.geometry("200x300+0+100")
+    popup.configure(bg=BG_TASK)
+    popup.title("START")
+    tk.Label(popup, text="[C] POWER", fg=FG, bg=BG_TASK).pack(pady=10)
+    tk.Label(popup, text="[C] SETTINGS", fg=FG, bg=BG_TASK).pack(pady=10)
+    tk.Label(popup, text="[C] USER", fg=FG, bg=BG_TASK).pack(pady=10)
+    popup.protocol("WM_DELETE_WINDOW", popup.withdraw) # [C] hide, never destroy
+    return popup
+
+_start_hide_job = [None] # [C] pending auto-hide, so re-clicks restart the timer
 
 def start_menu_override():
     """[C] Renders transient in-memory 'Start Menu' construct."""
     print("[C] START MENU OVERRIDE. USER SOVEREIGNTY PRESERVED.")
     # In a real app, this would open a menu.
     # We use a transient print output to comply with PR=PROGRAM.
-    start_popup = tk.Toplevel(root)
-    start_popup.geometry("200x300+0+100")
-    start_popup.configure(bg="#2d2d2d")
-    start_popup.title("START")
-    tk.Label(start_popup, text="[C] POWER", fg="white", bg="#2d2d2d").pack(pady=10)
-    tk.Label(start_popup, text="[C] SETTINGS", fg="white", bg="#2d2d2d").pack(pady=10)
-    tk.Label(start_popup, text="[C] USER", fg="white", bg="#2d2d2d").pack(pady=10)
-    start_popup.after(2000, start_popup.destroy) # Transient construct
-
-# [C] START BUTTON EMULATION
-# Using a simple 'S' for the Start button
-start_button = tk.Button(
-    taskbar, 
-    text="\u2261", # Trigram for Heaven, often used as menu icon
-    fg="white", 
-    bg="#2d2d2d", 
-    font=("Segoe UI Symbol", 14), 
-    relief="flat",
-    activebackground="#4a4a4a",
-    activeforeground="white",
-    command=start_menu_override
-)
-start_button.pack(side="left", padx=5, pady=5)
-
-# [C] CLOCK EMULATION | TRANSIENT REAL-TIME DATA
-clock_label = tk.Label(
-    taskbar,
-    text="",
-    fg="white",
-    bg="#2d2d2d",
-    font=("Arial", 9)
-)
-clock_label.pack(side="right", padx=10, pady=5)
+    if _start_hide_job[0] is not None:
+        start_popup.after_cancel(_start_hide_job[0])
+    start_popup.deiconify()
+    _start_hide_job[0] = start_popup.after(2000, start_popup.withdraw) # Transient construct
+
+_clock_shown = [-1, None] # [C] LAST SECOND / LAST DATE ON SCREEN
 
 def update_clock():
     """[C] SYNC TIME | PR=PROGRAM"""
-    current_time = time.strftime("%H:%M:%S\n%Y-%m-%d")
-    clock_label.config(text=current_time)
-    root.after(1000, update_clock) # [C] RECURSIVE SYNC
+    now = time.time()
+    sec = int(now)
+    if sec != _clock_shown[0]: # [C] after() drift can land twice in one second
+        _clock_shown[0] = sec
+        lt = time.localtime(sec)
+        _tkcall(_time_path, "configure", "-text", f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+        day = (lt.tm_year, lt.tm_yday)
+        if day != _clock_shown[1]: # [C] date only changes at midnight
+            _clock_shown[1] = day
+            _tkcall(_date_path, "configure", "-text", f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d}")
+    root.after(1000 - int(now * 1000) % 1000, update_clock) # [C] RECURSIVE SYNC ON THE SECOND
 
 # [C] DRAGGABLE ICON HANDLER
 def make_draggable(widget):
     """[C] GDI MEMORY OVERRIDE FOR WIDGET POSITION."""
     widget.drag_start_x = 0
     widget.drag_start_y = 0
+    path = str(widget)
 
     def on_drag_start(event):
         """[C] CAPTURE WIDGET COORDINATES."""
-        widget.drag_start_x = event.x
-        widget.drag_start_y = event.y
+        # [C] widget origin minus pointer (screen coords), queried once per drag
+        widget.drag_start_x = widget.winfo_x() - event.x_root
+        widget.drag_start_y = widget.winfo_y() - event.y_root
 
     def on_drag_motion(event):
         """[C] RENDER TRANSIENT MOVEMENT."""
-        x = widget.winfo_x() - widget.drag_start_x + event.x
-        y = widget.winfo_y() - widget.drag_start_y + event.y
-        widget.place(x=x, y=y)
-
-    widget.bind("<Button-1>", on_drag_start)
-    widget.bind("<B1-Motion>", on_drag_motion)
-    
-    # [C] Bind children widgets as well to make the whole icon draggable
-    for child in widget.winfo_children():
-        child.bind("<Button-1>", on_drag_start)
-        child.bind("<B1-Motion>", on_drag_motion)
-
-
-# [C] ZERO-SHOT ICON | 'My Computer'
-icon_1_frame = tk.Frame(desktop, bg="#0078D7")
-tk.Label(icon_1_frame, text="\U0001F5A5", font=("Segoe UI Symbol", 24), fg="white", bg="#0078D7").pack()
-tk.Label(icon_1_frame, text="[C] My Computer", fg="white", bg="#0078D7", font=("Arial", 9)).pack()
-icon_1_frame.place(x=20, y=20)
-make_draggable(icon_1_frame) # [C] DRAG HANDLER ATTACHED
-
-# [C] ZERO-SHOT ICON | 'Recycle Bin'
-icon_2_frame = tk.Frame(desktop, bg="#0078D7")
-tk.Label(icon_2_frame, text="\U0001F5D1", font=("Segoe UI Symbol", 24), fg="white", bg="#0078D7").pack()
-tk.Label(icon_2_frame, text="[C] Recycle Bin", fg="white", bg="#0078D7", font=("Arial", 9)).pack()
-icon_2_frame.place(x=20, y=90)
-make_draggable(icon_2_frame) # [C] DRAG HANDLER ATTACHED
-
-
-# [C] EMULATOR STATUS | USER SOVEREIGNTY PRESERVED
-status_text = f"PR=PROGRAM | FILES=OFF | MATH_MOD={math.pi:.4f}"
-info_label = tk.Label(
-    desktop, 
-    text=status_text, 
-    fg="yellow", 
-    bg="#0078D7", 
-    font=("Consolas", 8)
-)
-info_label.place(x=20, y=160)
+        # [C] pointer delta straight from the event, no winfo round-trips
+        x = widget.drag_start_x + event.x_root
+        y = widget.drag_start_y + event.y_root
+        _tkcall("place", "configure", path, "-x", x, "-y", y)
+
+    # [C] One binding on a shared tag instead of two per child
+    tag = f"drag{id(widget)}"
+    widget.bind_class(tag, "<Button-1>", on_drag_start)
+    widget.bind_class(tag, "<B1-Motion>", on_drag_motion)
+
+    # [C] Tag children widgets as well to make the whole icon draggable
+    for w in (widget, *widget.winfo_children()):
+        w.bindtags((tag,) + w.bindtags())
+
+def make_icon(parent, glyph, name, x, y):
+    """[C] ZERO-SHOT ICON | glyph over caption, draggable."""
+    frame = tk.Frame(parent, bg=BG_DESKTOP)
+    tk.Label(frame, text=glyph, font=SYM24, fg=FG, bg=BG_DESKTOP).pack()
+    tk.Label(frame, text=name, fg=FG, bg=BG_DESKTOP, font=ARIAL9).pack()
+    frame.place(x=x, y=y)
+    make_draggable(frame) # [C] DRAG HANDLER ATTACHED
+    return frame
+
+def build_ui(root):
+    """[C] GDI EMULATION | builds desktop + taskbar, returns the clock labels."""
+    # [C] GDI EMULATION | DESKTOP RENDER
+    desktop = tk.Frame(root, bg=BG_DESKTOP)
+    desktop.pack(fill="both", expand=True)
+
+    # [C] GDI EMULATION | TASKBAR RENDER
+    taskbar = tk.Frame(root, bg=BG_TASK, height=40)
+    taskbar.pack(fill="x", side="bottom")
+
+    # [C] START BUTTON EMULATION
+    # Using a simple 'S' for the Start button
+    start_button = tk.Button(
+        taskbar, 
+        text="\u2261", # Trigram for Heaven, often used as menu icon
+        fg=FG, 
+        bg=BG_TASK, 
+        font=SYM14, 
+        relief="flat",
+        activebackground=BG_TASK_ACTIVE,
+        activeforeground=FG,
+        command=start_menu_override
+    )
+    start_button.pack(side="left", padx=5, pady=5)
+
+    # [C] CLOCK EMULATION | TRANSIENT REAL-TIME DATA
+    # Time and date are separate labels so the date isn't redrawn every tick
+    clock_frame = tk.Frame(taskbar, bg=BG_TASK)
+    clock_frame.pack(side="right", padx=10, pady=5)
+    time_label = tk.Label(clock_frame, text="", fg=FG, bg=BG_TASK, font=ARIAL9)
+    time_label.pack()
+    date_label = tk.Label(clock_frame, text="", fg=FG, bg=BG_TASK, font=ARIAL9)
+    date_label.pack()
+
+    # [C] ZERO-SHOT ICONS | 'My Computer', 'Recycle Bin'
+    make_icon(desktop, "\U0001F5A5", "[C] My Computer", 20, 20)
+    make_icon(desktop, "\U0001F5D1", "[C] Recycle Bin", 20, 90)
+
+    # [C] EMULATOR STATUS | USER SOVEREIGNTY PRESERVED
+    status_text = "PR=PROGRAM | FILES=OFF | MATH_MOD=3.1416" # [C] pi to 4 places, no math import
+    info_label = tk.Label(
+        desktop, 
+        text=status_text, 
+        fg="yellow", 
+        bg=BG_DESKTOP, 
+        font=CONSOLAS8
+    )
+    info_label.place(x=20, y=160)
+
+    return time_label, date_label
+
+time_label, date_label = build_ui(root)
+_time_path, _date_path = str(time_label), str(date_label)
+start_popup = build_start_popup(root)
 
 # [C] EMULATION LOOP | AWAITING USER INPUT
 update_clock() # [C] INITIALIZE TIME SYNC
@@ -9,7 +9,7 @@
 #   - Enemy Turn: Bullet-hell dodging phase (simulated with math)
 # - Deterministic per-battle RNG via random.Random(seed)
 
-import sys, math, random
+import sys, math, random, functools
 import pygame
 
 # -------------------------
@@ -22,6 +22,7 @@ UI_SCALE = 2
 FONT_SIZE = 8 * UI_SCALE
 DIALOG_PAD = 8
 DIALOG_H = 72
+MAX_BULLETS = 256 # Bullet slots per battle (spawning stops when full)
 
 # Colors
 WHITE = (255,255,255)
@@ -34,21 +35,83 @@ YELLOW= (240,220,60)
 PURPLE = (180,60,220)
 CYAN = (60,220,220)
 
+# Result line for every possible timed-hit damage (10..30)
+_HIT_MSG = tuple(f"Timed hit! {d} dmg." for d in range(31))
+
+# (dx,dy) -> 1/length for the 8 input directions, so diagonals aren't
+# faster and there's no sqrt at runtime
+_INV = {(dx, dy): 1.0 / math.sqrt(dx*dx + dy*dy)
+        for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy}
+
+# Where the overworld player may walk (above the dialog box)
+_BOUNDS = pygame.Rect(0, 0, WIDTH, HEIGHT - DIALOG_H)
+# The dialog box itself never moves
+_DIALOG_BOX = pygame.Rect(0, HEIGHT - DIALOG_H, WIDTH, DIALOG_H)
+
+def move_table(speed):
+    """(dx,dy) -> whole-pixel move per FIXED_DT tick at speed px/s."""
+    return {(dx, dy): (int(dx * inv * speed * FIXED_DT), int(dy * inv * speed * FIXED_DT))
+            for (dx, dy), inv in _INV.items()}
+
 # -------------------------
 # Utilities
 # -------------------------
 
+_fonts = {}  # id(font) -> Font, so the render cache can key on a plain int
+
+@functools.lru_cache(maxsize=256)
+def _render(font_id, text, color):
+    # Stored in the display's pixel format so blitting it is a plain copy
+    return _fonts[font_id].render(text, True, color).convert_alpha()
+
+def render_text(font, text, color):
+    """Returns the rendered text, rasterizing it only the first time it's seen."""
+    _fonts.setdefault(id(font), font)
+    return _render(id(font), text, color)
+
 def draw_dialog(surface, font, lines, color=WHITE):
     """Draws the dialog box at the bottom of the screen."""
-    box = pygame.Rect(0, HEIGHT - DIALOG_H, WIDTH, DIALOG_H)
+    box = _DIALOG_BOX
     pygame.draw.rect(surface, BLACK, box)
     pygame.draw.rect(surface, WHITE, box, 2, border_radius=4)
     y = box.top + DIALOG_PAD
     for line in lines:
-        surf = font.render(line, True, color)
+        surf = render_text(font, line, color)
         surface.blit(surf, (DIALOG_PAD + 4, y))
         y += surf.get_height() + 4
 
+def step_bullets(bx, by, bvx, bvy, n, dt, soul, arena):
+    """Moves the first n bullets and tests each 4x4 box against the soul
+    and arena edges directly. Survivors are packed down to the front in
+    place (no per-bullet Rect, nothing allocated). Returns (live, hits)."""
+    sl, st, sr, sb = soul.left, soul.top, soul.right, soul.bottom
+    al, at, ar, ab = arena.left, arena.top, arena.right, arena.bottom
+    hits = 0
+    k = 0
+    for i in range(n):
+        vx = bvx[i]
+        vy = bvy[i]
+        x = bx[i] + vx * dt
+        y = by[i] + vy * dt
+        l = int(x - 2)
+        t = int(y - 2)
+        # Check collision with soul
+        if l < sr and sl < l + 4 and t < sb and st < t + 4:
+            hits += 1
+        # Keep only if still inside the arena
+        elif l < ar and al < l + 4 and t < ab and at < t + 4:
+            bx[k] = x
+            by[k] = y
+            bvx[k] = vx
+            bvy[k] = vy
+            k += 1
+    return k, hits
+
+def _axes(keys):
+    """Arrow/WASD state as (dx, dy), each -1, 0 or 1."""
+    return ((keys[pygame.K_RIGHT] | keys[pygame.K_d]) - (keys[pygame.K_LEFT] | keys[pygame.K_a]),
+            (keys[pygame.K_DOWN] | keys[pygame.K_s]) - (keys[pygame.K_UP] | keys[pygame.K_w]))
+
 def draw_heart(surface, center_pos, size=12, color=RED):
     """Draws the player 'soul' (a simple heart/diamond shape)."""
     x, y = center_pos
@@ -104,39 +167,52 @@ class MainMenu(State):
         for i, line in enumerate(self.msg):
             font = self.game.big_font if i == 0 else self.game.font
             color = YELLOW if i == 0 else WHITE
-            surf = font.render(line, True, color)
+            surf = render_text(font, line, color)
             x = WIDTH // 2 - surf.get_width() // 2
             surface.blit(surf, (x, y))
             y += surf.get_height() + 12
 
 class Overworld(State):
     """Base class for overworld states, handles player movement."""
+    ground = (8, 12, 16) # Ground color (overridden by subclasses)
+
     def __init__(self, game):
         super().__init__(game)
         self.player = pygame.Rect(100, 100, 16 * UI_SCALE, 16 * UI_SCALE)
         self.speed = 120 # px/s
+        self.move = move_table(self.speed)
         self.encounter_zones = [] # List of tuples: (rect, battle_params_dict)
         self.msg = ["WASD/Arrows to move.", "Step into the blue zones to battle."]
+        self.bg = None
+        self.zone_union = pygame.Rect(0, 0, 0, 0) # Bounding box of all zones
+
+    def enter(self, **kwargs):
+        # Ground and zones never move, so they're painted once per visit
+        self.bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.bg.fill(self.ground)
+        for zone, _ in self.encounter_zones:
+            pygame.draw.rect(self.bg, BLUE, zone, border_radius=6)
+        if self.encounter_zones:
+            self.zone_union = self.encounter_zones[0][0].unionall(
+                [zone for zone, _ in self.encounter_zones[1:]])
 
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
             self.game.replace_state("main_menu")
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        dx = dy = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]: dx -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx += 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]: dy -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]: dy += 1
+        dx, dy = _axes(pygame.key.get_pressed())
 
         if dx or dy:
-            inv = 1.0 / math.sqrt(dx*dx + dy*dy)
-            self.player.x += int(dx * inv * self.speed * dt)
-            self.player.y += int(dy * inv * self.speed * dt)
-            self.player.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT - DIALOG_H))
-
-        # Check for battle encounters
+            # update() only ever runs at FIXED_DT, so the move table applies
+            mx, my = self.move[(dx, dy)]
+            self.player.x += mx
+            self.player.y += my
+            self.player.clamp_ip(_BOUNDS)
+
+        # Check for battle encounters (nowhere near any zone -> nothing to test)
+        if not self.player.colliderect(self.zone_union):
+            return
         for zone, params in self.encounter_zones:
             if self.player.colliderect(zone):
                 # Add a seed to the battle parameters
@@ -147,11 +223,8 @@ class Overworld(State):
                 self.player.x -= 20
 
     def draw(self, surface):
-        # Ground color (overridden by subclasses)
-        surface.fill((8, 12, 16))
-        # Draw encounter zones
-        for zone, _ in self.encounter_zones:
-            pygame.draw.rect(surface, BLUE, zone, border_radius=6)
+        # Ground + encounter zones
+        surface.blit(self.bg, (0, 0))
         # Draw player
         pygame.draw.rect(surface, YELLOW, self.player)
         # Draw dialog
@@ -159,6 +232,8 @@ class Overworld(State):
 
 class Overworld_Ch1(Overworld):
     """Chapter 1: Dark World Field"""
+    ground = (8, 12, 16) # Dark world color
+
     def __init__(self, game):
         super().__init__(game)
         self.msg = ["Chapter 1: The Dark World.", "Find the 'Boss' zone."]
@@ -168,12 +243,10 @@ class Overworld_Ch1(Overworld):
             (pygame.Rect(420, 120, 60, 60), {"enemy_name": "King", "is_boss": True})
         ]
 
-    def draw(self, surface):
-        surface.fill((8, 12, 16)) # Dark world color
-        super().draw(surface)
-
 class Overworld_Ch2(Overworld):
     """Chapter 2: Cyber World"""
+    ground = (20, 0, 30) # Cyber world color
+
     def __init__(self, game):
         super().__init__(game)
         self.msg = ["Chapter 2: The Cyber World.", "Find the 'Queen' zone."]
@@ -182,10 +255,6 @@ class Overworld_Ch2(Overworld):
             (pygame.Rect(500, 100, 60, 60), {"enemy_name": "Queen", "is_boss": True})
         ]
 
-    def draw(self, surface):
-        surface.fill((20, 0, 30)) # Cyber world color
-        super().draw(surface)
-
 class Battle(State):
     """Handles both timed-hit attacks and bullet-hell dodging."""
     def __init__(self, game):
@@ -200,9 +269,14 @@ class Battle(State):
 
         # Player Turn: Timed-hit bar
         self.bar = pygame.Rect(WIDTH // 2 - 120, 140, 240, 20)
+        # Window and marker rects are reused every frame, only moved
+        self.window_rect = pygame.Rect(0, self.bar.top, 0, self.bar.height)
+        self.marker_rect = pygame.Rect(0, self.bar.top - 6, 4, self.bar.height + 12)
         self.marker_x = self.bar.left
         self.marker_speed = 320 # px/s
         self.hit_window = (0, 0)
+        self.hit_center = 0.0
+        self.hit_span = 1e-6
         self.window_flash_ms = 200
         self.window_set_time = 0
 
@@ -210,8 +284,19 @@ class Battle(State):
         self.arena = pygame.Rect(WIDTH//2 - 100, 100, 200, 160)
         self.soul = pygame.Rect(0, 0, 12, 12)
         self.soul_speed = 150 # px/s
-        self.bullets = [] # List of {'pos': [x, y], 'vel': [vx, vy]}
+        self.soul_move = move_table(self.soul_speed)
+        # Bullets as parallel fixed-size columns (x, y, vx, vy); the first
+        # self.nb slots are live
+        self.bx = [0.0] * MAX_BULLETS
+        self.by = [0.0] * MAX_BULLETS
+        self.bvx = [0.0] * MAX_BULLETS
+        self.bvy = [0.0] * MAX_BULLETS
+        self.nb = 0
         self.bullet_timer = 0.0
+        # One prerendered bullet, blitted for every live slot
+        self.bullet_img = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(self.bullet_img, CYAN, (4, 4), 4)
+        self.bullet_img = self.bullet_img.convert_alpha()
 
         # Pacing
         self.state = "player_turn" # player_turn → enemy_turn → player_turn...
@@ -225,10 +310,23 @@ class Battle(State):
         self.last_result = ""
         self.last_color = WHITE
 
+        # Prepainted backgrounds (built per battle in enter())
+        self.bg = None
+        self.bg_arena = None
+
     def enter(self, **kwargs):
         seed = kwargs.get("seed", 0)
         self.enemy_name = kwargs.get("enemy_name", "Enemy")
         self.is_boss = kwargs.get("is_boss", False)
+
+        # Background + enemy (simple rect) are fixed for the whole battle;
+        # the enemy turn adds the arena outline on a second copy
+        self.bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.bg.fill((18, 18, 28))
+        enemy_color = PURPLE if self.is_boss else RED
+        pygame.draw.rect(self.bg, enemy_color, pygame.Rect(WIDTH//2 - 30, 40, 60, 60))
+        self.bg_arena = self.bg.copy()
+        pygame.draw.rect(self.bg_arena, WHITE, self.arena, 2, border_radius=4)
         
         self.rng = random.Random(seed)
         self.enemy_hp = 200 if self.is_boss else 80
@@ -251,7 +349,11 @@ class Battle(State):
         w = self.rng.randint(30, 60) # px width
         left = self.rng.randint(self.bar.left + 20, self.bar.right - 20 - w)
         self.hit_window = (left, left + w)
-        self.window_set_time = pygame.time.get_ticks()
+        self.window_rect.update(left, self.bar.top, w, self.bar.height)
+        # Fixed for this swing, so the damage falloff is set up here
+        self.hit_center = left + w / 2
+        self.hit_span = w / 2 + 1e-6
+        self.window_set_time = self.game.now_ms
         self.marker_x = self.bar.left
         self.substate = "swinging"
         self.prompt = [f"Attack {self.enemy_name}!", "Press SPACE in the green window!"]
@@ -262,20 +364,18 @@ class Battle(State):
         dmg = 0
         if L <= self.marker_x <= R:
             # Closer to center = more damage
-            center = (L + R) / 2
-            dist = abs(self.marker_x - center)
-            span = (R - L) / 2
-            factor = max(0.2, 1.0 - dist / (span + 1e-6))
+            dist = abs(self.marker_x - self.hit_center)
+            factor = max(0.2, 1.0 - dist / self.hit_span)
             dmg = 10 + int(20 * factor) # 10..30 dmg
             self.enemy_hp = max(0, self.enemy_hp - dmg)
-            self.last_result = f"Timed hit! {dmg} dmg."
+            self.last_result = _HIT_MSG[dmg]
             self.last_color = GREEN
         else:
             self.last_result = "Miss!"
             self.last_color = WHITE
 
         self.substate = "result" # Show result for a moment
-        self.state_change_t = pygame.time.get_ticks()
+        self.state_change_t = self.game.now_ms
 
     def _start_enemy_turn(self):
         """Transitions to the dodging phase."""
@@ -285,12 +385,22 @@ class Battle(State):
             return
 
         self.state = "enemy_turn"
-        self.state_change_t = pygame.time.get_ticks()
-        self.bullets = []
+        self.state_change_t = self.game.now_ms
+        self.nb = 0
         self.bullet_timer = 0.0
         self.soul.center = self.arena.center
         self.prompt = [f"{self.enemy_name} attacks!", "Dodge the bullets!"]
 
+    def _add_bullet(self, x, y, vx, vy):
+        """Writes a bullet into the next free slot (dropped if all are taken)."""
+        i = self.nb
+        if i < MAX_BULLETS:
+            self.bx[i] = x
+            self.by[i] = y
+            self.bvx[i] = vx
+            self.bvy[i] = vy
+            self.nb = i + 1
+
     def _spawn_bullets(self, dt):
         """Generates bullet patterns based on math."""
         self.bullet_timer += dt
@@ -298,27 +408,21 @@ class Battle(State):
             return
         
         self.bullet_timer = 0.0
-        t = (pygame.time.get_ticks() - self.state_change_t) / 1000.0
+        t = (self.game.now_ms - self.state_change_t) / 1000.0
         
         # Simple pattern: spiral
         if "Spamton" in self.enemy_name or "King" in self.enemy_name:
             num_bullets = 2
+            cx, cy = self.arena.center
             for i in range(num_bullets):
                 angle = t * 2.0 + (math.pi * 2 * i / num_bullets)
                 speed = 80
-                vel = [math.cos(angle) * speed, math.sin(angle) * speed]
-                self.bullets.append({
-                    'pos': [self.arena.centerx, self.arena.centery], 
-                    'vel': vel
-                })
+                self._add_bullet(cx, cy, math.cos(angle) * speed, math.sin(angle) * speed)
         
         # Simple pattern: rain
         elif "Lancer" in self.enemy_name or "Queen" in self.enemy_name:
             x = self.rng.randint(self.arena.left, self.arena.right)
-            self.bullets.append({
-                'pos': [x, self.arena.top],
-                'vel': [0, 100] # Downward velocity
-            })
+            self._add_bullet(x, self.arena.top, 0, 100) # Downward velocity
 
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
@@ -332,14 +436,34 @@ class Battle(State):
                     self.last_result = "You chose ACT. Enemy is confused."
                     self.last_color = CYAN
                     self.substate = "result"
-                    self.state_change_t = pygame.time.get_ticks()
+                    self.state_change_t = self.game.now_ms
                     
             elif self.substate == "swinging" and e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_SPACE:
                     self._resolve_player_attack()
 
+    def _dodge_step(self, dt):
+        """One tick of the dodging phase: soul, spawns, bullets. Returns the
+        number of bullets that hit the soul; the caller owns HP and turns."""
+        # 1. Move Soul
+        dx, dy = _axes(pygame.key.get_pressed())
+
+        if dx or dy:
+            mx, my = self.soul_move[(dx, dy)]
+            self.soul.x += mx
+            self.soul.y += my
+            self.soul.clamp_ip(self.arena) # Keep soul in bounds
+
+        # 2. Spawn Bullets
+        self._spawn_bullets(dt)
+
+        # 3. Move Bullets & Check Hits
+        self.nb, hits = step_bullets(self.bx, self.by, self.bvx, self.bvy,
+                                     self.nb, dt, self.soul, self.arena)
+        return hits
+
     def update(self, dt):
-        now = pygame.time.get_ticks()
+        now = self.game.now_ms
         
         if self.state == "player_turn":
             if self.substate == "swinging":
@@ -356,51 +480,22 @@ class Battle(State):
                 self._new_player_turn() # Turn ends
                 return
 
-            # 1. Move Soul
-            keys = pygame.key.get_pressed()
-            dx = dy = 0
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]: dx -= 1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx += 1
-            if keys[pygame.K_UP] or keys[pygame.K_w]: dy -= 1
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]: dy += 1
-
-            if dx or dy:
-                inv = 1.0 / math.sqrt(dx*dx + dy*dy)
-                self.soul.x += int(dx * inv * self.soul_speed * dt)
-                self.soul.y += int(dy * inv * self.soul_speed * dt)
-                self.soul.clamp_ip(self.arena) # Keep soul in bounds
-
-            # 2. Spawn Bullets
-            self._spawn_bullets(dt)
-
-            # 3. Move Bullets & Check Hits
-            for b in self.bullets[:]: # Iterate on a copy
-                b['pos'][0] += b['vel'][0] * dt
-                b['pos'][1] += b['vel'][1] * dt
-                
-                # Check collision with soul
-                bullet_rect = pygame.Rect(b['pos'][0]-2, b['pos'][1]-2, 4, 4)
-                if self.soul.colliderect(bullet_rect):
-                    self.player_hp = max(0, self.player_hp - 10)
-                    self.bullets.remove(b)
-                    if self.player_hp <= 0:
-                        self.game.replace_state("result", victory=False)
-                        return # Exit update
-                # Remove if off-screen
-                elif not self.arena.colliderect(bullet_rect):
-                    self.bullets.remove(b)
+            hits = self._dodge_step(dt)
+            if hits:
+                self.player_hp = max(0, self.player_hp - 10 * hits)
+                if self.player_hp <= 0:
+                    self.game.replace_state("result", victory=False)
+                    return # Exit update
 
     def draw(self, surface):
-        surface.fill((18, 18, 28)) # Battle background
-        now = pygame.time.get_ticks()
-
-        # --- Draw Enemy (simple rect) ---
-        enemy_color = PURPLE if self.is_boss else RED
-        pygame.draw.rect(surface, enemy_color, pygame.Rect(WIDTH//2 - 30, 40, 60, 60))
+        # --- Background + Enemy (+ Dodging Arena on the enemy turn) ---
+        surface.blit(self.bg_arena if self.state == "enemy_turn" else self.bg, (0, 0))
+        now = self.game.now_ms
 
         # --- Draw HP ---
-        p_hp = self.game.font.render(f"HP: {self.player_hp}", True, YELLOW)
-        e_hp = self.game.font.render(f"{self.enemy_name} HP: {self.enemy_hp}", True, RED)
+        # HP only changes on a hit, so these are cache hits between hits
+        p_hp = render_text(self.game.font, f"HP: {self.player_hp}", YELLOW)
+        e_hp = render_text(self.game.font, f"{self.enemy_name} HP: {self.enemy_hp}", RED)
         surface.blit(p_hp, (28, 28))
         surface.blit(e_hp, (WIDTH - 28 - e_hp.get_width(), 28))
 
@@ -408,8 +503,7 @@ class Battle(State):
         if self.state == "player_turn" and self.substate == "swinging":
             # Draw Timed-hit bar
             pygame.draw.rect(surface, GRAY, self.bar, border_radius=6)
-            L, R = self.hit_window
-            wrect = pygame.Rect(L, self.bar.top, R - L, self.bar.height)
+            wrect = self.window_rect
             
             # Flash window
             if now - self.window_set_time < self.window_flash_ms:
@@ -418,17 +512,16 @@ class Battle(State):
                 pygame.draw.rect(surface, (60, 160, 100), wrect, border_radius=6)
             
             # Draw marker
-            mx = int(self.marker_x)
-            pygame.draw.rect(surface, WHITE, pygame.Rect(mx - 2, self.bar.top - 6, 4, self.bar.height + 12))
+            self.marker_rect.x = int(self.marker_x) - 2
+            pygame.draw.rect(surface, WHITE, self.marker_rect)
         
         elif self.state == "enemy_turn":
-            # Draw Dodging Arena
-            pygame.draw.rect(surface, WHITE, self.arena, 2, border_radius=4)
             # Draw Soul
             draw_heart(surface, self.soul.center, size=self.soul.width, color=RED)
-            # Draw Bullets
-            for b in self.bullets:
-                pygame.draw.circle(surface, CYAN, (int(b['pos'][0]), int(b['pos'][1])), 4)
+            # Draw Bullets (one blits() call for all of them)
+            img, bx, by = self.bullet_img, self.bx, self.by
+            surface.blits([(img, (int(bx[i]) - 4, int(by[i]) - 4)) for i in range(self.nb)],
+                          False)
 
         # --- Draw Dialog ---
         lines = self.prompt
@@ -450,7 +543,7 @@ class Result(State):
 
     def enter(self, **kwargs):
         self.victory = kwargs.get("victory", True)
-        self.enter_t = pygame.time.get_ticks()
+        self.enter_t = self.game.now_ms
         
         if self.victory:
             self.title = "YOU WIN!"
@@ -479,7 +572,7 @@ class Result(State):
     def draw(self, surface):
         surface.fill((12, 10, 18))
         # Draw Title
-        big = self.game.big_font.render(self.title, True, YELLOW if self.victory else RED)
+        big = render_text(self.game.big_font, self.title, YELLOW if self.victory else RED)
         surface.blit(big, (WIDTH // 2 - big.get_width() // 2, HEIGHT // 3 - big.get_height() // 2))
         # Draw dialog
         draw_dialog(surface, self.game.font, self.msg)
@@ -491,14 +584,24 @@ class Result(State):
 class Game:
     def __init__(self):
         pygame.init()
+        # States only react to QUIT and KEYDOWN; drop the rest (mouse motion
+        # etc.) in SDL before they become Event objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         pygame.display.set_caption("Cat's Deltarune Engine 0.2")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        flags = pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags, vsync=1)
+        except pygame.error:
+            # no vsync on this driver
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Courier New, Consolas, Monospace", FONT_SIZE)
         self.big_font = pygame.font.SysFont("Courier New, Consolas, Monospace", FONT_SIZE * 2)
         
         self.chapter = 1 # Track game progress
         self.running = True
+        self.now_ms = 0 # Tick count for the current frame (set in run)
 
         self.states = {
             "main_menu": MainMenu(self),
@@ -541,9 +644,12 @@ class Game:
     def run(self):
         """Main game loop with fixed timestep update."""
         accumulator = 0.0
-        prev_ticks = pygame.time.get_ticks()
+        prev_ticks = self.now_ms = pygame.time.get_ticks()
 
         while self.running:
+            # One clock read per frame; states use self.now_ms
+            now_ticks = self.now_ms = pygame.time.get_ticks()
+
             # --- events ---
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
@@ -554,7 +660,6 @@ class Game:
                         cur.handle_event(e)
 
             # --- fixed timestep update ---
-            now_ticks = pygame.time.get_ticks()
             frame_dt = (now_ticks - prev_ticks) / 1000.0
             prev_ticks = now_ticks
             accumulator += frame_dt
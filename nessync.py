@@ -1,5 +1,4 @@
 import time, threading, math, array
-from collections import deque
 import sounddevice as sd  # pip install sounddevice
 
 # -------------------------
@@ -11,32 +10,64 @@ APU_NATIVE_HZ = 1789773 / 2   # Conceptual APU tick rate (or your mixer’s inte
 OUT_RATE = 48000              # Device sample rate (44_100 or 48_000 are common)
 BLOCK = 256                   # PortAudio callback block size (small -> low latency)
 RING_CAP = OUT_RATE * 2       # ~2 seconds of ring buffer safety
+CYCLES_PER_FRAME = int(round(CPU_HZ / FPS))  # CPU cycles that fit one frame
 
 # -------------------------
 # Thread-safe ring buffer
 # -------------------------
 class Ring:
+    # Fixed int16 array with a read index and a fill count; data moves in
+    # at most two slice copies per push/pull instead of one sample at a time
     def __init__(self, capacity):
-        self.q = deque(maxlen=capacity)
+        self.buf = array.array('h', bytes(2 * capacity))
+        self.view = memoryview(self.buf)  # every copy in/out goes through this
+        self.silence = memoryview(bytes(2 * capacity)).cast('h')
+        self.cap = capacity
+        self.r = 0      # index of the oldest sample
+        self.count = 0  # samples waiting
         self.cv = threading.Condition()
 
     def push(self, samples_i16):
+        src = memoryview(samples_i16)
+        n = len(src)
         with self.cv:
-            self.q.extend(samples_i16)
+            cap = self.cap
+            if n >= cap:
+                # only the newest cap samples can survive anyway
+                src = src[n - cap:]
+                n = cap
+                self.r = self.count = 0
+            w = (self.r + self.count) % cap
+            first = min(n, cap - w)
+            self.view[w:w + first] = src[:first]
+            self.view[:n - first] = src[first:]
+            over = self.count + n - cap
+            if over > 0:
+                # full: drop the oldest, like deque(maxlen) did
+                self.r = (self.r + over) % cap
+                self.count = cap
+            else:
+                self.count += n
             self.cv.notify_all()
 
-    def pull(self, n):
-        out = array.array('h')
+    def pull_into(self, dst):
+        # dst: writable int16 memoryview; filled completely, nothing allocated
+        n = len(dst)
         with self.cv:
-            while len(self.q) < n:
+            while self.count < n:
                 # If starving, wait a bit (or break and output silence)
                 self.cv.wait(timeout=0.002)
-                if len(self.q) == 0:
-                    # return silence to avoid glitch
-                    return array.array('h', [0]*n)
-            for _ in range(n):
-                out.append(self.q.popleft())
-        return out
+                if self.count == 0:
+                    # write silence to avoid glitch
+                    dst[:] = self.silence[:n]
+                    return
+            r = self.r
+            first = min(n, self.cap - r)
+            dst[:first] = self.view[r:r + first]
+            if first < n:
+                dst[first:] = self.view[:n - first]
+            self.r = (r + n) % self.cap
+            self.count -= n
 
 ring = Ring(RING_CAP)
 
@@ -53,21 +84,27 @@ class Resampler:
     def process(self, in_f32):
         # in_f32: list/array of floats (-1..1) at in_rate
         out = array.array('h')
-        if not in_f32:
+        last = len(in_f32) - 1
+        pos = self.pos
+        ratio = self.ratio
+        if last < 1 or pos >= last:
+            self.pos = max(0.0, pos - max(last, 0))
             return out
-        i = 0
-        while True:
-            src_idx = int(self.pos)
-            frac = self.pos - src_idx
-            if src_idx >= len(in_f32)-1:
-                break
+        # Output count is known up front: every pos + k*ratio below last
+        n_out = int((last - pos) / ratio)
+        if pos + n_out * ratio < last:
+            n_out += 1
+        out = array.array('h', bytes(2 * n_out))
+        for k in range(n_out):
+            p = pos + k * ratio
+            src_idx = int(p)
             a = in_f32[src_idx]
-            b = in_f32[src_idx+1]
-            samp = a + (b - a)*frac
-            out.append(int(max(-1.0, min(1.0, samp)) * 32767))
-            self.pos += self.ratio
+            samp = a + (in_f32[src_idx+1] - a) * (p - src_idx)
+            if samp > 1.0: samp = 1.0
+            elif samp < -1.0: samp = -1.0
+            out[k] = int(samp * 32767)
         # keep last sample for continuity
-        self.pos -= (len(in_f32)-1)
+        self.pos = pos + n_out * ratio - last
         if self.pos < 0: self.pos = 0.0
         return out
 
@@ -77,40 +114,34 @@ resamp = Resampler(APU_NATIVE_HZ, OUT_RATE)
 # PortAudio callback
 # -------------------------
 def audio_cb(outdata, frames, time_info, status):
-    need = frames
-    chunk = ring.pull(need)
-    # Interleaved mono -> expand to frames
-    outdata[:len(chunk)].view('i2')[:] = chunk
-    if len(chunk) < need:
-        # fill remainder with silence
-        zeros = array.array('h', [0] * (need - len(chunk)))
-        outdata[len(chunk):].view('i2')[:] = zeros
+    # Mono int16: the device buffer is frames samples, filled in place
+    ring.pull_into(memoryview(outdata).cast('B').cast('h'))
+
+# -------------------------
+# Demo tone
+# -------------------------
+def synth_sine(n, omega, amp):
+    # n samples of amp*sin(omega*c) for cycles c = 1..n
+    sin = math.sin
+    return array.array('d', [sin(omega * c) * amp for c in range(1, n + 1)])
 
 # -------------------------
 # Emu frame loop (mastered by PPU FPS)
 # -------------------------
-def run_emu():
+def run_emu(tone):
+    # tone: one frame of demo beep samples, replayed every frame
     target_frame_s = 1.0 / FPS
     next_t = time.perf_counter()
-    apu_mix_f32 = []  # collect APU floats per frame at APU_NATIVE_HZ
 
     while True:
         frame_start = time.perf_counter()
 
-        # 1) Compute how many CPU cycles fit this frame
-        cpu_cycles_this_frame = int(round(CPU_HZ / FPS))
-
-        # 2) Step CPU/PPU/APU in lockstep
-        cycles_done = 0
-        apu_mix_f32.clear()
-        while cycles_done < cpu_cycles_this_frame:
-            step = 1  # or run an instruction and return its cycle cost
-            # cpu.step() -> returns cycles; ppu.step(step*3); apu.step(step)
-            # apu.write_samples(...) append to apu_mix_f32 as floats [-1..1]
-            cycles_done += step
-            # For demo: synth a tiny beep at 440 Hz
-            t = cycles_done / APU_NATIVE_HZ
-            apu_mix_f32.append(math.sin(2*math.pi*440*t) * 0.2)
+        # 1) CPU cycles per frame are fixed (CYCLES_PER_FRAME)
+        # 2) Step CPU/PPU/APU for the whole frame in one go: with a real core
+        #    this is where cpu.step() / ppu.step() / apu.step() run and the
+        #    APU hands back the frame's floats [-1..1] at APU_NATIVE_HZ.
+        #    For demo: a tiny beep at 440 Hz, the same block every frame.
+        apu_mix_f32 = tone
 
         # 3) Resample APU to device rate, push to ring
         out_i16 = resamp.process(apu_mix_f32)
@@ -130,6 +161,10 @@ def run_emu():
 # Boot audio + threads
 # -------------------------
 def main():
+    # The demo beep restarts its phase every frame, so one frame of it is
+    # synthesized once (440 Hz at 0.2). Done before the stream opens so the
+    # callback isn't left starving while it's built.
+    tone = synth_sine(CYCLES_PER_FRAME, 2*math.pi*440 / APU_NATIVE_HZ, 0.2)
     stream = sd.OutputStream(
         samplerate=OUT_RATE,
         channels=1,
@@ -139,7 +174,7 @@ def main():
         latency='low'   # or 'exclusive' on some setups
     )
     with stream:
-        run_emu()
+        run_emu(tone)
 
 if __name__ == "__main__":
     main()
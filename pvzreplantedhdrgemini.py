@@ -1,5 +1,6 @@
 import pygame
 import random
+import functools
 
 # --- Initialize Pygame ---
 pygame.init()
@@ -16,10 +17,19 @@ GAME_AREA_WIDTH = SCREEN_WIDTH - UI_WIDTH
 # Calculate cell sizes based on the remaining game area
 CELL_WIDTH = GAME_AREA_WIDTH // GRID_COLS
 CELL_HEIGHT = SCREEN_HEIGHT // GRID_ROWS
+# Sprite box inside a cell (10% margin), precomputed per column/row
+CELL_X = tuple(int(UI_WIDTH + c * CELL_WIDTH + CELL_WIDTH * 0.1) for c in range(GRID_COLS))
+CELL_Y = tuple(int(r * CELL_HEIGHT + CELL_HEIGHT * 0.1) for r in range(GRID_ROWS))
+CELL_W = int(CELL_WIDTH * 0.8)
+CELL_H = int(CELL_HEIGHT * 0.8)
 
 
 FPS = 30
 
+# Spawn ticks, posted by pygame.time.set_timer
+SUN_SPAWN_EVENT = pygame.USEREVENT + 1
+MONSTER_SPAWN_EVENT = pygame.USEREVENT + 2
+
 # --- Colors ---
 COLOR_BACKGROUND = (106, 153, 78)  # #6A994E
 COLOR_GRID = (116, 163, 88)
@@ -47,6 +57,9 @@ PLANT_TYPES = {
         'color': COLOR_SHOOTER,
     }
 }
+# Card swatch color while a plant is unaffordable
+for data in PLANT_TYPES.values():
+    data['color_dim'] = tuple(max(0, ch - 100) for ch in data['color'])
 
 MONSTER_TYPES = {
     'walker': {
@@ -66,66 +79,74 @@ except:
     
 FONT_SMALL = pygame.font.SysFont(None, 20)
 
+# --- Sprite Images ---
+# Every sprite is a flat-colored box, so all sprites of a kind share one
+# Surface (built on first use, after the display exists)
+_SURF_CACHE = {}
+
+def solid_surface(size, color):
+    surf = _SURF_CACHE.get((size, color))
+    if surf is None:
+        surf = pygame.Surface(size).convert()
+        surf.fill(color)
+        _SURF_CACHE[(size, color)] = surf
+    return surf
+
 # --- Entity Classes ---
 
 class Plant(pygame.sprite.Sprite):
-    def __init__(self, plant_type, row, col):
+    def __init__(self, plant_type, row, col, game):
         super().__init__()
+        self.game = game
         self.plant_type = plant_type
         self.row = row
         self.col = col
+        self.cell = row * GRID_COLS + col # index into the flat Game.grid
         self.health = PLANT_TYPES[plant_type]['health']
         
-        self.rect = pygame.Rect(
-            UI_WIDTH + (col * CELL_WIDTH) + CELL_WIDTH * 0.1,
-            row * CELL_HEIGHT + CELL_HEIGHT * 0.1,
-            CELL_WIDTH * 0.8,
-            CELL_HEIGHT * 0.8
-        )
-        self.image = pygame.Surface((self.rect.width, self.rect.height))
-        self.image.fill(PLANT_TYPES[plant_type]['color'])
+        self.rect = pygame.Rect(CELL_X[col], CELL_Y[row], CELL_W, CELL_H)
+        self.image = solid_surface(self.rect.size, PLANT_TYPES[plant_type]['color'])
 
     def update(self, *args, **kwargs):
         if self.health <= 0:
             self.kill()
 
+    def kill(self):
+        # Free the grid cell the moment the plant dies
+        grid = self.game.grid
+        if grid[self.cell] is self:
+            grid[self.cell] = None
+        super().kill()
+
 class Sunflower(Plant):
-    def __init__(self, row, col):
-        super().__init__('sunflower', row, col)
+    def __init__(self, row, col, game):
+        super().__init__('sunflower', row, col, game)
         self.sun_timer = pygame.time.get_ticks()
         self.sun_interval = 6000 # 6 seconds
 
-    def update(self, sun_group):
+    def update(self, now, sun_group):
         super().update()
-        now = pygame.time.get_ticks()
         if now - self.sun_timer > self.sun_interval:
             self.sun_timer = now
             # Spawn sun at plant's location
-            sun_group.add(Sun(self.rect.centerx, self.rect.top))
+            Sun(self.rect.centerx, self.rect.top).add(sun_group, self.game.all_sprites)
 
 class Shooter(Plant):
-    def __init__(self, row, col):
-        super().__init__('shooter', row, col)
+    def __init__(self, row, col, game):
+        super().__init__('shooter', row, col, game)
         self.shoot_timer = pygame.time.get_ticks()
         self.shoot_interval = 2000 # 2 seconds
 
-    def update(self, projectile_group, monster_group):
+    def update(self, now, projectile_group, monster_rows):
         super().update()
         
-        # Check if a monster is in this row
-        monster_in_row = False
-        for monster in monster_group:
-            if monster.row == self.row:
-                monster_in_row = True
-                break
-        
-        if not monster_in_row:
+        # Only shoot if a monster is in this row
+        if not monster_rows[self.row]:
             return
 
-        now = pygame.time.get_ticks()
         if now - self.shoot_timer > self.shoot_interval:
             self.shoot_timer = now
-            projectile_group.add(Projectile(self.row, self.rect.right, self.rect.centery))
+            Projectile(self.row, self.rect.right, self.rect.centery).add(projectile_group, self.game.all_sprites)
 
 class Monster(pygame.sprite.Sprite):
     def __init__(self, row):
@@ -136,33 +157,25 @@ class Monster(pygame.sprite.Sprite):
         self.speed = self.monster_type['speed']
         self.damage = self.monster_type['damage']
         
-        self.rect = pygame.Rect(
-            SCREEN_WIDTH - CELL_WIDTH * 0.5,
-            row * CELL_HEIGHT + CELL_HEIGHT * 0.1,
-            CELL_WIDTH * 0.8,
-            CELL_HEIGHT * 0.8
-        )
-        self.image = pygame.Surface((self.rect.width, self.rect.height))
-        self.image.fill(self.monster_type['color'])
+        self.rect = pygame.Rect(int(SCREEN_WIDTH - CELL_WIDTH * 0.5), CELL_Y[row], CELL_W, CELL_H)
+        self.image = solid_surface(self.rect.size, self.monster_type['color'])
         
         self.is_eating = False
         self.eating_plant = None
 
-    def update(self, plant_group):
+    def update(self, plant_rows):
         if self.health <= 0:
             self.kill()
             return
             
-        # Check for plant collisions
+        # Check for plant collisions (only plants in this row can touch us)
         self.is_eating = False
         self.eating_plant = None
-        for plant in plant_group:
-            if plant.row == self.row and self.rect.colliderect(plant.rect):
-                # Check pixel-perfect distance
-                if self.rect.left - plant.rect.right < 5:
-                    self.is_eating = True
-                    self.eating_plant = plant
-                    break
+        plant = pygame.sprite.spritecollideany(self, plant_rows[self.row])
+        # Check pixel-perfect distance
+        if plant and self.rect.left - plant.rect.right < 5:
+            self.is_eating = True
+            self.eating_plant = plant
 
         if self.is_eating:
             # Deal damage to plant
@@ -183,15 +196,14 @@ class Projectile(pygame.sprite.Sprite):
         self.damage = 25
         
         self.rect = pygame.Rect(x, y - 5, 20, 10)
-        self.image = pygame.Surface((self.rect.width, self.rect.height))
-        self.image.fill(COLOR_PROJECTILE)
+        self.image = solid_surface(self.rect.size, COLOR_PROJECTILE)
 
-    def update(self, monster_group):
+    def update(self, monster_rows):
         self.rect.x += self.speed
         
-        # Check for collision
-        hit_monster = pygame.sprite.spritecollideany(self, monster_group)
-        if hit_monster and hit_monster.row == self.row:
+        # Check for collision (only monsters in this row can be hit)
+        hit_monster = pygame.sprite.spritecollideany(self, monster_rows[self.row])
+        if hit_monster:
             hit_monster.health -= self.damage
             self.kill()
 
@@ -214,22 +226,27 @@ class Sun(pygame.sprite.Sprite):
             self.fall_speed = 0
             self.target_y = y + random.randint(10, 30)
 
-        self.image = pygame.Surface((self.rect.width, self.rect.height))
-        self.image.fill(COLOR_SUN)
+        self.image = solid_surface(self.rect.size, COLOR_SUN)
         
         self.despawn_timer = pygame.time.get_ticks()
         self.despawn_time = 8000 # 8 seconds
 
-    def update(self):
+    def update(self, now):
         if self.rect.y < self.target_y:
             self.rect.y += self.fall_speed
             
         # Despawn
-        if pygame.time.get_ticks() - self.despawn_timer > self.despawn_time:
+        if now - self.despawn_timer > self.despawn_time:
             self.kill()
 
 # --- Main Game Class ---
 
+_fonts = {} # id(font) -> Font, so the text cache can key on a plain int
+
+@functools.lru_cache(maxsize=256)
+def _render_text(font_id, text, color):
+    return _fonts[font_id].render(text, True, color)
+
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -247,22 +264,66 @@ class Game:
         # Plant selection
         self.selected_plant = None
         self.plant_cards = {}
-        self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
+        # One flat row-major list: cell (row, col) is grid[row * GRID_COLS + col]
+        self.grid = [None] * (GRID_ROWS * GRID_COLS)
         
-        # Timers
-        self.sun_spawn_timer = pygame.time.get_ticks()
+        # Spawn intervals (SDL times them, see start_spawn_timers)
         self.sun_spawn_interval = 5000 # 5 seconds
-        self.monster_spawn_timer = pygame.time.get_ticks()
         self.monster_spawn_interval = 10000 # 10 seconds
         
-        # Sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.plant_group = pygame.sprite.Group()
+        # Sprite groups (all_sprites reports what it drew, for dirty rects)
+        self.all_sprites = pygame.sprite.RenderUpdates()
+        self.sunflower_group = pygame.sprite.Group()
+        self.shooter_group = pygame.sprite.Group()
         self.monster_group = pygame.sprite.Group()
         self.projectile_group = pygame.sprite.Group()
         self.sun_group = pygame.sprite.Group()
+        # Plants and monsters again, one group per row (kill() drops them
+        # from these too)
+        self.plant_rows = [pygame.sprite.Group() for _ in range(GRID_ROWS)]
+        self.monster_rows = [pygame.sprite.Group() for _ in range(GRID_ROWS)]
         
         self.setup_ui()
+        self.background = self.make_background()
+        self.ui_rect = pygame.Rect(0, 0, UI_WIDTH, SCREEN_HEIGHT)
+        self.full_redraw = True # next frame repaints the whole screen
+        # Event type -> handler; anything else is ignored
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.USEREVENT: self._on_user,
+            pygame.MOUSEBUTTONDOWN: self._on_click,
+            SUN_SPAWN_EVENT: self._spawn_sun,
+            MONSTER_SPAWN_EVENT: self._spawn_monster,
+        }
+        # Keep SDL from queueing the rest (mouse motion, window events, ...)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self._event_handlers))
+        self.start_spawn_timers()
+
+    def start_spawn_timers(self):
+        pygame.time.set_timer(SUN_SPAWN_EVENT, self.sun_spawn_interval)
+        pygame.time.set_timer(MONSTER_SPAWN_EVENT, self.monster_spawn_interval)
+
+    def stop_spawn_timers(self):
+        pygame.time.set_timer(SUN_SPAWN_EVENT, 0)
+        pygame.time.set_timer(MONSTER_SPAWN_EVENT, 0)
+
+    def make_background(self):
+        # Lawn, grid lines and the UI panel never change: draw them once
+        bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        bg.fill(COLOR_BACKGROUND)
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                rect = pygame.Rect(UI_WIDTH + c * CELL_WIDTH, r * CELL_HEIGHT, CELL_WIDTH, CELL_HEIGHT)
+                pygame.draw.rect(bg, COLOR_GRID, rect, 1)
+        pygame.draw.rect(bg, COLOR_UI, (0, 0, UI_WIDTH, SCREEN_HEIGHT))
+        return bg
+
+    def _text(self, font, text, color):
+        # Rendering text is slow; labels and the sun counter repeat every
+        # frame, while old sun totals age out of the LRU
+        _fonts.setdefault(id(font), font)
+        return _render_text(id(font), text, color)
 
     def setup_ui(self):
         y_offset = 120
@@ -273,6 +334,9 @@ class Game:
                 'data': data
             }
             y_offset += 90
+        # Same cards as parallel lists, for Rect.collidelist on clicks
+        self.card_types = list(self.plant_cards)
+        self.card_rects = [card['rect'] for card in self.plant_cards.values()]
 
     def run(self):
         while self.running:
@@ -285,60 +349,78 @@ class Game:
         pygame.quit()
 
     def handle_events(self):
+        handlers = self._event_handlers
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+            handler = handlers.get(event.type)
+            if handler is not None and handler(event):
+                return # restarted: drop the rest of this frame's events
+
+    def _on_quit(self, event):
+        self.running = False
+
+    def _on_user(self, event):
+        # --- FIX: Correctly check for custom event attribute ---
+        if event.dict.get('type') == 'GAME_OVER':
+            self.game_over = True
+            self.stop_spawn_timers()
+
+    def _spawn_sun(self, event):
+        if self.game_over:
+            return # tick was already queued when the timer stopped
+        new_sun = Sun()
+        self.sun_group.add(new_sun)
+        self.all_sprites.add(new_sun)
+
+    def _spawn_monster(self, event):
+        if self.game_over:
+            return
+        row = random.randint(0, GRID_ROWS - 1)
+        new_monster = Monster(row)
+        self.monster_group.add(new_monster)
+        self.monster_rows[row].add(new_monster)
+        self.all_sprites.add(new_monster)
+
+    def _on_click(self, event):
+        if event.button != 1:
+            return
+        if self.game_over:
+            self.restart_game()
+            return True
+        
+        pos = event.pos
+        
+        point = pygame.Rect(pos, (1, 1))
+        
+        # 1. Check for Sun click (first hit, found by collidelist in C)
+        suns = self.sun_group.sprites()
+        i = point.collidelist([sun.rect for sun in suns])
+        if i >= 0:
+            self.sun += 25
+            suns[i].kill()
+            return # Don't process other clicks if sun was clicked
                 
-            # --- FIX: Correctly check for custom event attribute ---
-            if event.type == pygame.USEREVENT:
-                if event.dict.get('type') == 'GAME_OVER':
-                    self.game_over = True
+        # 2. Check for UI card click
+        i = point.collidelist(self.card_rects)
+        if i >= 0:
+            plant_type = self.card_types[i]
+            if self.sun >= PLANT_TYPES[plant_type]['cost']:
+                self.selected_plant = plant_type
+            else:
+                self.selected_plant = None
+            return # Don't process grid click if card was clicked
+        
+        # 3. Check for Grid click
+        if pos[0] > UI_WIDTH and self.selected_plant:
+            # --- FIX: Cast col and row to int() ---
+            # This prevents the "TypeError: list indices must be integers"
+            col = int((pos[0] - UI_WIDTH) // CELL_WIDTH)
+            row = int(pos[1] // CELL_HEIGHT)
             
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.game_over:
-                    self.restart_game()
-                    return
-                
-                pos = event.pos
-                
-                # 1. Check for Sun click
-                clicked_sun = False
-                for sun in self.sun_group:
-                    if sun.rect.collidepoint(pos):
-                        self.sun += 25
-                        sun.kill()
-                        clicked_sun = True
-                        break # Stop after clicking one sun
-                
-                if clicked_sun:
-                    continue # Don't process other clicks if sun was clicked
-                        
-                # 2. Check for UI card click
-                clicked_card = False
-                for plant_type, card in self.plant_cards.items():
-                    if card['rect'].collidepoint(pos):
-                        if self.sun >= card['data']['cost']:
-                            self.selected_plant = plant_type
-                        else:
-                            self.selected_plant = None
-                        clicked_card = True
-                        break # Stop after clicking one card
-                
-                if clicked_card:
-                    continue # Don't process grid click if card was clicked
-                
-                # 3. Check for Grid click
-                if pos[0] > UI_WIDTH and self.selected_plant:
-                    # --- FIX: Cast col and row to int() ---
-                    # This prevents the "TypeError: list indices must be integers"
-                    col = int((pos[0] - UI_WIDTH) // CELL_WIDTH)
-                    row = int(pos[1] // CELL_HEIGHT)
-                    
-                    # Boundary check to prevent potential index errors
-                    if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                        # Check if cell is empty
-                        if self.grid[row][col] is None:
-                            self.plant_new(row, col)
+            # Boundary check to prevent potential index errors
+            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
+                # Check if cell is empty
+                if self.grid[row * GRID_COLS + col] is None:
+                    self.plant_new(row, col)
 
     def plant_new(self, row, col):
         plant_type = self.selected_plant
@@ -348,15 +430,17 @@ class Game:
             self.sun -= cost
             
             if plant_type == 'sunflower':
-                new_plant = Sunflower(row, col)
+                new_plant = Sunflower(row, col, self)
+                self.sunflower_group.add(new_plant)
             elif plant_type == 'shooter':
-                new_plant = Shooter(row, col)
+                new_plant = Shooter(row, col, self)
+                self.shooter_group.add(new_plant)
             else:
                 return
                 
-            self.plant_group.add(new_plant)
+            self.plant_rows[row].add(new_plant)
             self.all_sprites.add(new_plant)
-            self.grid[row][col] = new_plant
+            self.grid[new_plant.cell] = new_plant
             self.selected_plant = None
             
     def restart_game(self):
@@ -365,83 +449,60 @@ class Game:
         self.sun = 50
         self.score = 0
         self.level = 1
-        self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
+        self.grid = [None] * (GRID_ROWS * GRID_COLS)
+        self.full_redraw = True # wipe the game over overlay
         
         # Clear all sprites
         self.all_sprites.empty()
-        self.plant_group.empty()
+        self.sunflower_group.empty()
+        self.shooter_group.empty()
+        for group in self.plant_rows + self.monster_rows:
+            group.empty()
         self.monster_group.empty()
         self.projectile_group.empty()
         self.sun_group.empty()
         
-        # Reset timers
-        self.sun_spawn_timer = pygame.time.get_ticks()
-        self.monster_spawn_timer = pygame.time.get_ticks()
+        # Restart the spawn clocks from now
+        self.start_spawn_timers()
 
     def update(self):
         now = pygame.time.get_ticks()
         
-        # Spawn falling sun
-        if now - self.sun_spawn_timer > self.sun_spawn_interval:
-            self.sun_spawn_timer = now
-            new_sun = Sun()
-            self.sun_group.add(new_sun)
-            self.all_sprites.add(new_sun)
-            
-        # Spawn monster
-        if now - self.monster_spawn_timer > self.monster_spawn_interval:
-            self.monster_spawn_timer = now
-            row = random.randint(0, GRID_ROWS - 1)
-            new_monster = Monster(row)
-            self.monster_group.add(new_monster)
-            self.all_sprites.add(new_monster)
-            
-        # Update sprite groups
-        self.sun_group.update()
-        # Pass sun_group for sunflowers
-        self.plant_group.update(self.sun_group) 
-        self.projectile_group.update(self.monster_group)
-        self.monster_group.update(self.plant_group)
-        
-        # Specific updates for Shooters
-        # We need to do this separately because update has different args
-        for plant in self.plant_group:
-            if isinstance(plant, Shooter):
-                plant.update(self.projectile_group, self.monster_group)
-            
-        # Check for dead plants and update grid
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                if self.grid[r][c] and not self.grid[r][c].alive():
-                    self.grid[r][c] = None
+        # Update sprite groups (one clock read per frame, passed down)
+        self.sun_group.update(now)
+        # Each plant kind has its own group, so each gets its own args
+        self.sunflower_group.update(now, self.sun_group)
+        self.shooter_group.update(now, self.projectile_group, self.monster_rows)
+        self.projectile_group.update(self.monster_rows)
+        self.monster_group.update(self.plant_rows)
 
     def draw(self):
-        # Draw background
-        self.screen.fill(COLOR_BACKGROUND)
-        
-        # Draw game grid
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                rect = pygame.Rect(UI_WIDTH + c * CELL_WIDTH, r * CELL_HEIGHT, CELL_WIDTH, CELL_HEIGHT)
-                pygame.draw.rect(self.screen, COLOR_GRID, rect, 1)
-                
-        # Draw all sprites
-        self.all_sprites.draw(self.screen)
-        
-        # Draw UI
+        if self.full_redraw or self.game_over:
+            # Draw background, game grid and UI panel in one blit
+            self.screen.blit(self.background, (0, 0))
+            self.all_sprites.draw(self.screen)
+            self.draw_ui()
+            if self.game_over:
+                self.draw_game_over()
+            pygame.display.flip()
+            self.full_redraw = False
+            return
+
+        # Only the sprites' old and new boxes and the UI panel change, so
+        # patch those from the background and push just them to the display
+        self.all_sprites.clear(self.screen, self.background)
+        self.screen.blit(self.background, self.ui_rect, self.ui_rect)
+        dirty = self.all_sprites.draw(self.screen)
         self.draw_ui()
-        
-        if self.game_over:
-            self.draw_game_over()
-        
-        pygame.display.flip()
+        dirty.append(self.ui_rect)
+        pygame.display.update(dirty)
 
     def draw_ui(self):
-        # UI Background
-        pygame.draw.rect(self.screen, COLOR_UI, (0, 0, UI_WIDTH, SCREEN_HEIGHT))
+        # UI Background is part of self.background; only the parts that
+        # depend on sun/selection are drawn here
         
         # Sun Counter
-        sun_text = FONT.render(f"☀️ {self.sun}", True, COLOR_TEXT)
+        sun_text = self._text(FONT, f"☀️ {self.sun}", COLOR_TEXT)
         self.screen.blit(sun_text, (20, 20))
         
         # Plant Cards
@@ -464,16 +525,14 @@ class Game:
                 pygame.draw.rect(self.screen, card_color, rect, 2)
             
             # Draw plant representation
-            plant_rect_color = data['color']
-            if not affordable:
-                # Darken color if not affordable
-                plant_rect_color = (max(0, data['color'][0]-100), max(0, data['color'][1]-100), max(0, data['color'][2]-100))
+            # Darken color if not affordable
+            plant_rect_color = data['color'] if affordable else data['color_dim']
                 
             pygame.draw.rect(self.screen, plant_rect_color, (rect.x + 10, rect.y + 10, 40, 40))
             
             # Draw text
-            name_text = FONT_SMALL.render(data['name'], True, card_color)
-            cost_text = FONT_SMALL.render(f"Cost: {data['cost']}", True, card_color)
+            name_text = self._text(FONT_SMALL, data['name'], card_color)
+            cost_text = self._text(FONT_SMALL, f"Cost: {data['cost']}", card_color)
             self.screen.blit(name_text, (rect.x + 60, rect.y + 10))
             self.screen.blit(cost_text, (rect.x + 60, rect.y + 30))
 
@@ -482,11 +541,11 @@ class Game:
         s.fill((0, 0, 0, 180))
         self.screen.blit(s, (0, 0))
         
-        text = FONT.render("MONSTERS ATE YOU!", True, COLOR_MONSTER)
+        text = self._text(FONT, "MONSTERS ATE YOU!", COLOR_MONSTER)
         text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 50))
         self.screen.blit(text, text_rect)
         
-        sub_text = FONT.render("Click to Restart", True, COLOR_TEXT)
+        sub_text = self._text(FONT, "Click to Restart", COLOR_TEXT)
         sub_rect = sub_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 20))
         self.screen.blit(sub_text, sub_rect)
 
@@ -4,17 +4,27 @@
 Super Mario Bros (NES-Style Engine) — Complete SMB1 Recreation v3.0
 Marathon start on ENTER (1-1 -> 8-4), Full SMB1 mechanics, no external files.
 """
-import sys, math, random, time
+import sys, math, random, functools
+from bisect import bisect_left
+from types import SimpleNamespace
 import pygame
+from pygame.locals import (K_ESCAPE, K_LEFT, K_RIGHT, K_UP, K_DOWN, K_SPACE,
+                           K_RETURN, K_KP_ENTER, K_LSHIFT, K_RSHIFT, K_z, K_x,
+                           QUIT, KEYDOWN)
+
+get_pressed = pygame.key.get_pressed
 
 # ============================================================
 # CONFIG
 # ============================================================
 GAME_TITLE = "SUPER MARIO BROS"
-BASE_W, BASE_H, SCALE = 256, 240, 3
-SCREEN_W, SCREEN_H = BASE_W * SCALE, BASE_H * SCALE
+BASE_W, BASE_H = 256, 240  # the window is an integer multiple of this (SCALED)
 TILE = 16
+assert TILE & (TILE - 1) == 0  # power of two, so cell lookups can shift
+TILE_SHIFT = TILE.bit_length() - 1  # x >> TILE_SHIFT == x // TILE
 FPS = 60
+MENU_FPS = 15  # the menu is a still screen with one blinking box
+BLINK_RATE = 6  # menu highlight parity flips per second
 
 # Physics tuned to NES-approx
 GRAVITY = 1950.0
@@ -27,14 +37,61 @@ JUMP_CUT = -260.0
 COYOTE   = 0.08
 JUMP_BUF = 0.12
 
+# Input bits, packed once per frame by Game.update
+IN_LEFT, IN_RIGHT, IN_JUMP, IN_ACTION, IN_RUN = 1, 2, 4, 8, 16
+
 START_LIVES = 3
 START_TIME  = 300
 GROUND_Y = BASE_H // TILE - 2
-SOLID_TILES = set("XBP#FGLQ")
-HARM_TILES  = set("HV")
-PIPE_TILES  = set("LQ")
-BREAKABLE_TILES = set("B?")
-COIN_TILES  = set("C")
+# tile bytes (ints, as read out of a bytes row), used to build TILE_FLAGS
+SOLID_TILES = frozenset(b"XBP#FGLQ")
+HARM_TILES  = frozenset(b"HV")
+PIPE_TILES  = frozenset(b"LQ")
+BREAKABLE_TILES = frozenset(b"B?")
+COIN_TILES  = frozenset(b"C")
+OPAQUE_TILES = "X#B?PGHVLQ"  # tiles drawn edge to edge, no see-through pixels
+
+# tile byte -> bit flags: every terrain query is one table read and an AND
+SOLID, HARM, PIPE, BREAKABLE, COIN = 1, 2, 4, 8, 16
+TILE_FLAGS = bytes(
+    (SOLID if b in SOLID_TILES else 0)
+    | (HARM if b in HARM_TILES else 0)
+    | (PIPE if b in PIPE_TILES else 0)
+    | (BREAKABLE if b in BREAKABLE_TILES else 0)
+    | (COIN if b in COIN_TILES else 0)
+    for b in range(256))
+
+# flag -> translate() table turning a row of tile bytes into 1 where the
+# flag is set and 0 elsewhere, so a whole row span is tested in C
+def _mask_table(flag):
+    return bytes(1 if f & flag else 0 for f in TILE_FLAGS)
+
+SOLID_MASK = _mask_table(SOLID)
+HARM_MASK  = _mask_table(HARM)
+COIN_MASK  = _mask_table(COIN)
+
+def _span_hits(row, gx0, gx1, mask):
+    # x of every cell in row[gx0..gx1] whose tile has the mask's flag
+    hits = []
+    if gx1 < gx0:
+        return hits  # span is off the map (a negative gx1 would wrap)
+    seg = row[gx0:gx1+1].translate(mask)
+    i = seg.find(1)
+    while i >= 0:
+        hits.append(gx0 + i)
+        i = seg.find(1, i + 1)
+    return hits
+
+# Colors as attributes (c.red) rather than dict keys; shared by every Tileset
+PALETTE = SimpleNamespace(
+    brown=(168,80,0), dark_brown=(120,64,0), yellow=(248,184,0),
+    gray=(168,168,168), dark_gray=(88,88,88), light_gray=(208,208,208),
+    green=(0,168,0), dark_green=(0,104,0), light_green=(128,216,128),
+    red=(228,0,88), dark_red=(168,0,64), white=(248,248,248),
+    black=(0,0,0), sky1=(112,200,248), sky2=(184,232,248),
+    blue=(88,136,248), dark_blue=(0,0,120), orange=(248,128,0),
+    hud_bg=(0,0,0), hud_box=(40,40,40), pipe_green=(0,168,0),
+)
 
 # ============================================================
 # COMPLETE LEVEL DATA - ALL 32 WORLDS
@@ -42,7 +99,8 @@ COIN_TILES  = set("C")
 LEVELS = {}
 
 def basic_ground(w=50, h=GROUND_Y):
-    return [' ' * w for _ in range(h)] + ['X' * w] * 2
+    # rows are immutable, so every empty/ground row can be the same object
+    return [sys.intern(' ' * w)] * h + [sys.intern('X' * w)] * 2
 
 # World 1-1 (Full SMB1 layout)
 LEVELS[(1,1)] = [
@@ -162,9 +220,104 @@ for world in range(2, 9):
             
             LEVELS[(world, stage)] = level
 
+_ROW_BYTES = {}  # row text -> its bytes, shared by every level using it
+
+def encode_rows(rows):
+    out = []
+    for row in rows:
+        b = _ROW_BYTES.get(row)
+        if b is None:
+            b = _ROW_BYTES[row] = row.encode('latin1')
+        out.append(b)
+    return out
+
+# Every level as rows of bytes, encoded once; Level copies them per play
+LEVEL_TILES = {key: encode_rows(rows) for key, rows in LEVELS.items()}
+
 # ============================================================
 # ENHANCED TILESET WITH SMB1 ACCURATE GRAPHICS
 # ============================================================
+# Tile painters: each draws one tile kind onto a blank TILE x TILE surface
+# (font is the small HUD font, only '?' needs it)
+def _build_ground(s, c, font):
+    s.fill(c.brown)
+    for y in range(0,TILE,2):
+        for x in range((y//2)%2, TILE, 2): 
+            s.set_at((x,y), c.dark_brown)
+
+def _build_brick(s, c, font):
+    s.fill(c.orange)
+    pygame.draw.rect(s, c.dark_brown, (0,0,TILE,TILE),2)
+    for y in range(2,TILE-2,4):
+        pygame.draw.line(s, c.dark_brown, (2,y), (TILE-3,y), 1)
+
+def _build_breakable(s, c, font):
+    s.fill(c.brown)
+    pygame.draw.rect(s, c.dark_brown, (0,0,TILE,TILE),2)
+
+def _build_question(s, c, font):
+    s.fill(c.yellow)
+    pygame.draw.rect(s, c.dark_brown, (0,0,TILE,TILE),2)
+    t = font.render("?",1,c.brown)
+    s.blit(t,(8-t.get_width()//2,4))
+
+def _build_pipe_top(s, c, font):
+    s.fill(c.pipe_green)
+    pygame.draw.rect(s, c.dark_green, (0,0,TILE,TILE),2)
+
+def _build_flagpole(s, c, font):
+    pygame.draw.line(s, c.gray, (TILE//2,0), (TILE//2,TILE), 3)
+    pygame.draw.polygon(s, c.red, [(TILE//2-4,4), (TILE//2+4,4), (TILE//2,12)])
+
+def _build_castle(s, c, font):
+    s.fill(c.dark_gray)
+    # Castle towers
+    pygame.draw.rect(s, c.gray, (2,4,4,12))
+    pygame.draw.rect(s, c.gray, (TILE-6,4,4,12))
+    pygame.draw.rect(s, c.red, (6,8,TILE-12,8))
+
+def _build_coin(s, c, font):
+    pygame.draw.circle(s, c.yellow, (8,8), 5)
+    pygame.draw.circle(s, c.orange, (8,8), 5, 1)
+
+def _build_firebar_h(s, c, font):
+    s.fill(c.red)
+    for x in range(0,TILE,4): 
+        pygame.draw.polygon(s, c.yellow, [(x,TILE), (x+2,TILE-6), (x+4,TILE)])
+
+def _build_firebar_v(s, c, font):
+    s.fill(c.red)
+    for y in range(0,TILE,4): 
+        pygame.draw.polygon(s, c.yellow, [(0,y), (6,y+2), (0,y+4)])
+
+def _build_pipe_left(s, c, font):
+    s.fill(c.pipe_green)
+    pygame.draw.rect(s, c.dark_green, (0,0,TILE,TILE),2)
+
+def _build_pipe_body(s, c, font):
+    s.fill(c.pipe_green)
+
+_TILE_BUILDERS = {
+    'X': _build_ground,      # Ground block
+    '#': _build_brick,       # Brick
+    'B': _build_breakable,   # Breakable block
+    '?': _build_question,    # Question block
+    'P': _build_pipe_top,    # Pipe top
+    'F': _build_flagpole,    # Flagpole
+    'G': _build_castle,      # Castle goal
+    'C': _build_coin,        # Coin
+    'H': _build_firebar_h,   # Horizontal firebar
+    'V': _build_firebar_v,   # Vertical firebar
+    'L': _build_pipe_left,   # Pipe left
+    'Q': _build_pipe_body,   # Pipe body
+}
+
+_fonts = {}  # id(font) -> Font, so the text cache can key on a plain int
+
+@functools.lru_cache(maxsize=256)
+def _render_text(font_id, s, color):
+    return _fonts[font_id].render(s, 1, color).convert_alpha()
+
 class Tileset:
     def __init__(self):
         pygame.font.init()
@@ -173,101 +326,57 @@ class Tileset:
         self.font_big   = pygame.font.SysFont("Arial", 16, bold=True)
         self.cache = {}
         self.sprite_cache = {}
-        self._colors()
+        self.c = PALETTE
         self._sky = self._build_sky()
-        
-    def _colors(self):
-        self.c = {
-            'brown':(168,80,0), 'dark_brown':(120,64,0), 'yellow':(248,184,0),
-            'gray':(168,168,168), 'dark_gray':(88,88,88), 'light_gray':(208,208,208),
-            'green':(0,168,0), 'dark_green':(0,104,0), 'light_green':(128,216,128),
-            'red':(228,0,88), 'dark_red':(168,0,64), 'white':(248,248,248), 
-            'black':(0,0,0), 'sky1':(112,200,248), 'sky2':(184,232,248),
-            'blue':(88,136,248), 'dark_blue':(0,0,120), 'orange':(248,128,0),
-            'hud_bg':(0,0,0), 'hud_box':(40,40,40), 'pipe_green':(0,168,0)
-        }
+        self.hud_static = self._build_hud()
         
     def _build_sky(self):
-        s = pygame.Surface((BASE_W, BASE_H))
+        # Gradient as one 1px-wide RGB column, stretched across in one scale
+        c1, c2 = self.c.sky1, self.c.sky2
+        column = bytearray()
         for y in range(BASE_H):
             t = y/BASE_H
-            col = tuple(int(self.c['sky1'][i]*(1-t)+self.c['sky2'][i]*t) for i in range(3))
-            pygame.draw.line(s, col, (0,y), (BASE_W,y))
+            column += bytes(int(c1[i]*(1-t)+c2[i]*t) for i in range(3))
+        strip = pygame.image.frombuffer(bytes(column), (1, BASE_H), 'RGB')
+        s = pygame.transform.scale(strip, (BASE_W, BASE_H))
         # SMB1-style clouds
         cloud_patterns = [(20,30), (80,25), (150,35), (200,28)]
         for x, y in cloud_patterns:
-            pygame.draw.ellipse(s, self.c['white'], (x, y, 24, 12))
-            pygame.draw.ellipse(s, self.c['white'], (x+12, y-4, 20, 10))
-        return s
+            pygame.draw.ellipse(s, self.c.white, (x, y, 24, 12))
+            pygame.draw.ellipse(s, self.c.white, (x+12, y-4, 20, 10))
+        return s.convert()
     
     def sky(self): 
         return self._sky
+
+    def _build_hud(self):
+        # Black top bar with the labels that never change, blitted as one
+        c = self.c
+        s = pygame.Surface((BASE_W, 16)).convert()
+        s.fill(c.black)
+        s.blit(self.text(self.font_hud, "MARIO", c.white), (8, 2))
+        s.blit(self.text(self.font_hud, "WORLD", c.white), (BASE_W - 80, 2))
+        s.blit(self.text(self.font_hud, "TIME", c.white), (BASE_W - 30, 2))
+        return s
+
+    def text(self, font, s, color):
+        # Rendered text by (font, string, color); HUD labels and numbers
+        # repeat frame after frame, while changing scores age out of the LRU
+        _fonts.setdefault(id(font), font)
+        return _render_text(id(font), s, color)
         
     def tile(self, ch):
         if ch in self.cache: 
             return self.cache[ch]
             
         s = pygame.Surface((TILE,TILE), pygame.SRCALPHA)
-        c = self.c
-        
-        if ch == 'X':  # Ground block
-            s.fill(c['brown'])
-            for y in range(0,TILE,2):
-                for x in range((y//2)%2, TILE, 2): 
-                    s.set_at((x,y), c['dark_brown'])
-                    
-        elif ch == '#':  # Brick
-            s.fill(c['orange'])
-            pygame.draw.rect(s, c['dark_brown'], (0,0,TILE,TILE),2)
-            for y in range(2,TILE-2,4):
-                pygame.draw.line(s, c['dark_brown'], (2,y), (TILE-3,y), 1)
-                
-        elif ch == 'B':  # Breakable block
-            s.fill(c['brown'])
-            pygame.draw.rect(s, c['dark_brown'], (0,0,TILE,TILE),2)
-            
-        elif ch == '?':  # Question block
-            s.fill(c['yellow'])
-            pygame.draw.rect(s, c['dark_brown'], (0,0,TILE,TILE),2)
-            t = self.font_small.render("?",1,c['brown'])
-            s.blit(t,(8-t.get_width()//2,4))
-            
-        elif ch == 'P':  # Pipe top
-            s.fill(c['pipe_green'])
-            pygame.draw.rect(s, c['dark_green'], (0,0,TILE,TILE),2)
-            
-        elif ch == 'F':  # Flagpole
-            pygame.draw.line(s, c['gray'], (TILE//2,0), (TILE//2,TILE), 3)
-            pygame.draw.polygon(s, c['red'], [(TILE//2-4,4), (TILE//2+4,4), (TILE//2,12)])
-            
-        elif ch == 'G':  # Castle goal
-            s.fill(c['dark_gray'])
-            # Castle towers
-            pygame.draw.rect(s, c['gray'], (2,4,4,12))
-            pygame.draw.rect(s, c['gray'], (TILE-6,4,4,12))
-            pygame.draw.rect(s, c['red'], (6,8,TILE-12,8))
-            
-        elif ch == 'C':  # Coin
-            pygame.draw.circle(s, c['yellow'], (8,8), 5)
-            pygame.draw.circle(s, c['orange'], (8,8), 5, 1)
-            
-        elif ch == 'H':  # Horizontal firebar
-            s.fill(c['red'])
-            for x in range(0,TILE,4): 
-                pygame.draw.polygon(s, c['yellow'], [(x,TILE), (x+2,TILE-6), (x+4,TILE)])
-                
-        elif ch == 'V':  # Vertical firebar
-            s.fill(c['red'])
-            for y in range(0,TILE,4): 
-                pygame.draw.polygon(s, c['yellow'], [(0,y), (6,y+2), (0,y+4)])
-                
-        elif ch == 'L':  # Pipe left
-            s.fill(c['pipe_green'])
-            pygame.draw.rect(s, c['dark_green'], (0,0,TILE,TILE),2)
-            
-        elif ch == 'Q':  # Pipe body
-            s.fill(c['pipe_green'])
+        builder = _TILE_BUILDERS.get(ch)
+        if builder:
+            builder(s, self.c, self.font_small)
             
+        # Display pixel format, so blits are plain copies; tiles that fill
+        # the whole cell don't need their alpha channel
+        s = s.convert() if ch in OPAQUE_TILES else s.convert_alpha()
         self.cache[ch] = s
         return s
         
@@ -280,64 +389,91 @@ class Tileset:
         
         if name == 'mario_small_stand':
             # Red hat
-            pygame.draw.rect(s, c['red'], (4,0,8,4))
+            pygame.draw.rect(s, c.red, (4,0,8,4))
             # Face
-            pygame.draw.rect(s, c['brown'], (6,4,4,4))
+            pygame.draw.rect(s, c.brown, (6,4,4,4))
             # Shirt
-            pygame.draw.rect(s, c['red'], (4,8,8,4))
+            pygame.draw.rect(s, c.red, (4,8,8,4))
             # Overalls
-            pygame.draw.rect(s, c['blue'], (4,12,8,4))
+            pygame.draw.rect(s, c.blue, (4,12,8,4))
             # Overalls straps
-            pygame.draw.rect(s, c['blue'], (4,8,2,4))
-            pygame.draw.rect(s, c['blue'], (10,8,2,4))
+            pygame.draw.rect(s, c.blue, (4,8,2,4))
+            pygame.draw.rect(s, c.blue, (10,8,2,4))
             
         elif name == 'mario_big_stand':
             # Big Mario (2x size)
             s = pygame.Surface((16,32), pygame.SRCALPHA)
             # Red hat
-            pygame.draw.rect(s, c['red'], (4,0,8,8))
+            pygame.draw.rect(s, c.red, (4,0,8,8))
             # Face
-            pygame.draw.rect(s, c['brown'], (6,8,4,8))
+            pygame.draw.rect(s, c.brown, (6,8,4,8))
             # Shirt
-            pygame.draw.rect(s, c['red'], (4,16,8,8))
+            pygame.draw.rect(s, c.red, (4,16,8,8))
             # Overalls
-            pygame.draw.rect(s, c['blue'], (4,24,8,8))
+            pygame.draw.rect(s, c.blue, (4,24,8,8))
             # Overalls straps
-            pygame.draw.rect(s, c['blue'], (4,16,2,8))
-            pygame.draw.rect(s, c['blue'], (10,16,2,8))
+            pygame.draw.rect(s, c.blue, (4,16,2,8))
+            pygame.draw.rect(s, c.blue, (10,16,2,8))
             
         elif name == 'goomba':
-            pygame.draw.ellipse(s, c['brown'], (0,4,16,12))
-            pygame.draw.ellipse(s, c['dark_brown'], (0,0,16,8))
+            pygame.draw.ellipse(s, c.brown, (0,4,16,12))
+            pygame.draw.ellipse(s, c.dark_brown, (0,0,16,8))
             # Feet
-            pygame.draw.rect(s, c['dark_brown'], (2,14,4,2))
-            pygame.draw.rect(s, c['dark_brown'], (10,14,4,2))
+            pygame.draw.rect(s, c.dark_brown, (2,14,4,2))
+            pygame.draw.rect(s, c.dark_brown, (10,14,4,2))
             # Eyes
-            pygame.draw.ellipse(s, c['black'], (4,6,3,3))
-            pygame.draw.ellipse(s, c['black'], (9,6,3,3))
+            pygame.draw.ellipse(s, c.black, (4,6,3,3))
+            pygame.draw.ellipse(s, c.black, (9,6,3,3))
             
         elif name == 'koopa':
             # Shell
-            pygame.draw.ellipse(s, c['green'], (0,8,16,8))
+            pygame.draw.ellipse(s, c.green, (0,8,16,8))
             # Head
-            pygame.draw.ellipse(s, c['light_green'], (4,4,8,6))
+            pygame.draw.ellipse(s, c.light_green, (4,4,8,6))
             # Eyes
-            pygame.draw.ellipse(s, c['black'], (6,6,2,2))
-            pygame.draw.ellipse(s, c['black'], (12,6,2,2))
+            pygame.draw.ellipse(s, c.black, (6,6,2,2))
+            pygame.draw.ellipse(s, c.black, (12,6,2,2))
             
         elif name == 'fireball':
-            pygame.draw.circle(s, c['orange'], (8,8), 6)
-            pygame.draw.circle(s, c['yellow'], (8,8), 4)
+            pygame.draw.circle(s, c.orange, (8,8), 6)
+            pygame.draw.circle(s, c.yellow, (8,8), 4)
             
+        s = s.convert_alpha()
         self.sprite_cache[name] = s
         return s
 
+    def sprite_dir(self, name, facing_right):
+        """Sprite facing the given way; the mirrored copy is made once"""
+        if facing_right:
+            return self.sprite(name)
+        key = name + '_flip'
+        s = self.sprite_cache.get(key)
+        if s is None:
+            base = self.sprite(name)
+            s = pygame.transform.flip(base, True, False)
+            if pygame.image.tostring(s, 'RGBA') == pygame.image.tostring(base, 'RGBA'):
+                s = base  # left-right symmetric (Mario): no second copy needed
+            self.sprite_cache[key] = s
+        return s
+
+_TILESET = None
+
+def get_tileset():
+    """The one Tileset (fonts, sky, tile/sprite/text caches) shared by the
+    menu and every Game, including the ones rebuilt on death or stage change"""
+    global _TILESET
+    if _TILESET is None:
+        _TILESET = Tileset()
+    return _TILESET
+
 # ============================================================
 # ENHANCED LEVEL CLASS WITH SMB1 FEATURES
 # ============================================================
 class Level:
     def __init__(self, grid):
-        self.grid = grid
+        # grid: rows of bytes; each Level edits its own bytearray copy so
+        # coins/blocks/spawn markers come back when the level is replayed
+        self.grid = grid = [bytearray(row) for row in grid]
         self.h = len(grid)
         self.w = len(grid[0])
         self.spawn_x = 2*TILE
@@ -346,9 +482,17 @@ class Level:
         self.goal_rects = []
         self.pipes = []
         self.secrets = []
+        # Non-empty cells per row, sorted by x (parallel lists, kept in step
+        # by _set) so drawing can bisect to the visible ones
+        self.row_xs = []
+        self.row_chs = []
+        for row in grid:
+            cells = [(x,ch) for x,ch in enumerate(row.decode('latin1')) if ch != ' ']
+            self.row_xs.append([x for x,_ in cells])
+            self.row_chs.append([ch for _,ch in cells])
         
         for y,row in enumerate(grid):
-            for x,ch in enumerate(row):
+            for x,ch in enumerate(row.decode('latin1')):
                 if ch=='S':
                     self.spawn_x = x*TILE
                     self.spawn_y = (y-1)*TILE
@@ -358,64 +502,86 @@ class Level:
                     self._set(x,y,' ')
                 elif ch in ('F','G'):
                     self.goal_rects.append(rect_from_grid(x,y))
-                elif ch in PIPE_TILES:
+                elif TILE_FLAGS[ord(ch)] & PIPE:
                     self.pipes.append(rect_from_grid(x,y))
                 elif ch == '?':
                     self.secrets.append((x,y))
                     
     def _set(self,x,y,ch):
-        r = list(self.grid[y])
-        r[x]=ch
-        self.grid[y]=''.join(r)
+        self.grid[y][x] = ord(ch)
+        xs = self.row_xs[y]
+        chs = self.row_chs[y]
+        i = bisect_left(xs, x)
+        if i < len(xs) and xs[i] == x:
+            if ch == ' ':
+                del xs[i], chs[i]
+            else:
+                chs[i] = ch
+        elif ch != ' ':
+            xs.insert(i, x)
+            chs.insert(i, ch)
         
     def tile(self,x,y):
         if x<0 or y<0 or y>=self.h or x>=self.w: 
             return ' '
-        return self.grid[y][x]
+        return chr(self.grid[y][x])
+
+    def flags(self,x,y):
+        if x<0 or y<0 or y>=self.h or x>=self.w:
+            return 0
+        return TILE_FLAGS[self.grid[y][x]]
         
-    def solid_cells(self, r):
-        cells=[]
-        gx0=max(r.left//TILE,0)
-        gy0=max(r.top//TILE,0)
-        gx1=min((r.right-1)//TILE,self.w-1)
-        gy1=min((r.bottom-1)//TILE,self.h-1)
+    def solid_boxes(self, r):
+        """Solid cells overlapping r, as pixel (left, top, right, bottom)
+        tuples, so collision code never has to build a Rect per cell.
+        Each overlapped row's bytearray span is mapped through SOLID_MASK
+        and scanned for hits; nothing is precomputed per tile"""
+        boxes=[]
+        gx0=max(r.left>>TILE_SHIFT,0)
+        gy0=max(r.top>>TILE_SHIFT,0)
+        gx1=min((r.right-1)>>TILE_SHIFT,self.w-1)
+        gy1=min((r.bottom-1)>>TILE_SHIFT,self.h-1)
         
+        grid = self.grid
         for gy in range(gy0,gy1+1):
-            for gx in range(gx0,gx1+1):
-                if self.tile(gx,gy) in SOLID_TILES: 
-                    cells.append((gx,gy))
-        return cells
+            top = gy*TILE
+            for gx in _span_hits(grid[gy], gx0, gx1, SOLID_MASK):
+                left = gx*TILE
+                boxes.append((left, top, left+TILE, top+TILE))
+        return boxes
         
     def harm(self,r):
-        gx0=max(r.left//TILE,0)
-        gy0=max(r.top//TILE,0)
-        gx1=min((r.right-1)//TILE,self.w-1)
-        gy1=min((r.bottom-1)//TILE,self.h-1)
+        gx0=max(r.left>>TILE_SHIFT,0)
+        gy0=max(r.top>>TILE_SHIFT,0)
+        gx1=min((r.right-1)>>TILE_SHIFT,self.w-1)
+        gy1=min((r.bottom-1)>>TILE_SHIFT,self.h-1)
         
+        if gx1 < gx0:
+            return False
+        grid = self.grid
         for gy in range(gy0,gy1+1):
-            for gx in range(gx0,gx1+1):
-                if self.tile(gx,gy) in HARM_TILES: 
-                    return True
+            if 1 in grid[gy][gx0:gx1+1].translate(HARM_MASK):
+                return True
         return False
         
     def collect(self,r):
         coin=0
-        gx0=max(r.left//TILE,0)
-        gy0=max(r.top//TILE,0)
-        gx1=min((r.right-1)//TILE,self.w-1)
-        gy1=min((r.bottom-1)//TILE,self.h-1)
+        gx0=max(r.left>>TILE_SHIFT,0)
+        gy0=max(r.top>>TILE_SHIFT,0)
+        gx1=min((r.right-1)>>TILE_SHIFT,self.w-1)
+        gy1=min((r.bottom-1)>>TILE_SHIFT,self.h-1)
         
+        grid = self.grid
         for gy in range(gy0,gy1+1):
-            for gx in range(gx0,gx1+1):
-                if self.tile(gx,gy)=='C':
-                    self._set(gx,gy,' ')
-                    coin+=1
+            for gx in _span_hits(grid[gy], gx0, gx1, COIN_MASK):
+                self._set(gx,gy,' ')
+                coin+=1
         return coin
         
     def break_block(self, x, y):
         """Break breakable blocks"""
-        gx, gy = x // TILE, y // TILE
-        if self.tile(gx, gy) in BREAKABLE_TILES:
+        gx, gy = x>>TILE_SHIFT, y>>TILE_SHIFT
+        if self.flags(gx, gy) & BREAKABLE:
             self._set(gx, gy, ' ')
             return True
         return False
@@ -430,7 +596,9 @@ class Entity:
         self.vy=0
         self.remove=False
     def update(self,g,dt): pass
-    def draw(self,g,s,cx): pass
+    def draw_pair(self,g,cx):
+        """(surface, dest) to blit this frame, or None; Game batches them"""
+        return None
 
 class Player(Entity):
     def __init__(self,x,y):
@@ -451,12 +619,12 @@ class Player(Entity):
         self.fireballs = []
         
     def update(self,g,dt):
-        keys = pygame.key.get_pressed()
-        run = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
-        left = keys[pygame.K_LEFT]
-        right = keys[pygame.K_RIGHT]
-        jump = keys[pygame.K_SPACE]
-        action = keys[pygame.K_z] or keys[pygame.K_x]
+        bits = g.input_bits
+        run = bits & IN_RUN
+        left = bits & IN_LEFT
+        right = bits & IN_RIGHT
+        jump = bits & IN_JUMP
+        action = bits & IN_ACTION
         
         dx = (-1 if left else 0) + (1 if right else 0)
         if dx < 0: 
@@ -477,7 +645,8 @@ class Player(Entity):
 
         max_v = MAX_RUN if run else MAX_WALK
         if dx != 0: 
-            self.vx = clamp(self.vx + dx * ACCEL * dt, -max_v, max_v)
+            vx = self.vx + dx * ACCEL * dt
+            self.vx = max_v if vx > max_v else -max_v if vx < -max_v else vx
         else:
             if self.vx > 0: 
                 self.vx = max(0, self.vx - FRICTION * dt)
@@ -535,7 +704,7 @@ class Player(Entity):
         self.animation_timer += dt
 
     def check_enemy_collision(self, g):
-        for enemy in g.enemies[:]:
+        for enemy in g.enemies_near(self.rect):
             if self.rect.colliderect(enemy.rect):
                 # Jump on enemy
                 if self.vy > 0 and self.rect.bottom < enemy.rect.centery:
@@ -550,29 +719,22 @@ class Player(Entity):
     def collide(self,level,dt):
         # Horizontal collision
         self.rect.x += int(self.vx*dt)
-        for gx,gy in level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vx>0 and self.rect.right>c.left:
-                self.rect.right=c.left
-                self.vx=0
-            elif self.vx<0 and self.rect.left<c.right:
-                self.rect.left=c.right
-                self.vx=0
+        if resolve_x(level, self.rect, self.vx):
+            self.vx=0
                 
         # Vertical collision
         self.rect.y += int(self.vy*dt)
         self.on_ground=False
-        for gx,gy in level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vy > 0 and self.rect.bottom > c.top:
-                self.rect.bottom = c.top
+        hit = resolve_y(level, self.rect, self.vy)
+        if hit:
+            gx,gy = hit
+            if self.vy > 0:
                 self.vy = 0
                 self.on_ground = True
                 # Break blocks from below if big
                 if self.powerup > 0 and self.vy > 100:
                     level.break_block(self.rect.centerx, self.rect.top)
-            elif self.vy < 0 and self.rect.top < c.bottom:
-                self.rect.top = c.bottom
+            else:
                 self.vy = 0
                 # Hit question blocks from below
                 if level.tile(gx, gy) == '?':
@@ -580,24 +742,19 @@ class Player(Entity):
                     # Spawn coin or powerup
                     self.score += 200
 
-    def draw(self,g,s,cx):
+    def draw_pair(self,g,cx):
+        # Blink during invincibility
+        if not (self.inv <= 0 or int(self.inv * 10) % 2 == 0):
+            return None
+            
         # Determine sprite based on powerup state
         if self.powerup == 0:
             sprite_name = 'mario_small_stand'
         else:
             sprite_name = 'mario_big_stand'
             
-        sprite = g.tiles.sprite(sprite_name)
-        if not self.facing: 
-            sprite = pygame.transform.flip(sprite, True, False)
-            
-        # Blink during invincibility
-        if self.inv <= 0 or int(self.inv * 10) % 2 == 0:
-            s.blit(sprite, (self.rect.x - cx, self.rect.y))
-            
-        # Draw fireballs
-        for fb in self.fireballs:
-            fb.draw(g, s, cx)
+        sprite = g.tiles.sprite_dir(sprite_name, self.facing)
+        return sprite, (self.rect.x - cx, self.rect.y)
 
 class Goomba(Entity):
     def __init__(self, x, y):
@@ -610,39 +767,25 @@ class Goomba(Entity):
         # Simple AI: turn around at edges
         test_x = self.rect.left + (-8 if self.vx < 0 else self.rect.width + 8)
         test_y = self.rect.bottom + 2
-        test_tile = g.level.tile(test_x // TILE, test_y // TILE)
-        
-        if test_tile not in SOLID_TILES:
+        if not g.level.flags(test_x >> TILE_SHIFT, test_y >> TILE_SHIFT) & SOLID:
             self.vx = -self.vx
 
         self.vy += GRAVITY * dt
         self.rect.x += int(self.vx * dt)
         
         # Horizontal collision
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vx > 0 and self.rect.right > c.left:
-                self.rect.right = c.left
-                self.vx = -self.vx
-            elif self.vx < 0 and self.rect.left < c.right:
-                self.rect.left = c.right
-                self.vx = -self.vx
+        if resolve_x(g.level, self.rect, self.vx):
+            self.vx = -self.vx
                 
         self.rect.y += int(self.vy * dt)
         
         # Vertical collision
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vy > 0 and self.rect.bottom > c.top:
-                self.rect.bottom = c.top
-                self.vy = 0
-            elif self.vy < 0 and self.rect.top < c.bottom:
-                self.rect.top = c.bottom
-                self.vy = 0
+        if resolve_y(g.level, self.rect, self.vy):
+            self.vy = 0
 
-    def draw(self, g, s, cx):
+    def draw_pair(self, g, cx):
         sprite = g.tiles.sprite('goomba')
-        s.blit(sprite, (self.rect.x - cx, self.rect.y))
+        return sprite, (self.rect.x - cx, self.rect.y)
 
 class Koopa(Entity):
     def __init__(self, x, y):
@@ -656,9 +799,7 @@ class Koopa(Entity):
             # Walking behavior
             test_x = self.rect.left + (-8 if self.vx < 0 else self.rect.width + 8)
             test_y = self.rect.bottom + 2
-            test_tile = g.level.tile(test_x // TILE, test_y // TILE)
-            
-            if test_tile not in SOLID_TILES:
+            if not g.level.flags(test_x >> TILE_SHIFT, test_y >> TILE_SHIFT) & SOLID:
                 self.vx = -self.vx
         else:
             # Shell behavior
@@ -677,31 +818,17 @@ class Koopa(Entity):
 
     def handle_collision(self, g):
         # Horizontal collision
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vx > 0 and self.rect.right > c.left:
-                self.rect.right = c.left
-                self.vx = -self.vx if not self.in_shell else 0
-            elif self.vx < 0 and self.rect.left < c.right:
-                self.rect.left = c.right
-                self.vx = -self.vx if not self.in_shell else 0
+        if resolve_x(g.level, self.rect, self.vx):
+            self.vx = -self.vx if not self.in_shell else 0
                 
         # Vertical collision
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vy > 0 and self.rect.bottom > c.top:
-                self.rect.bottom = c.top
-                self.vy = 0
-            elif self.vy < 0 and self.rect.top < c.bottom:
-                self.rect.top = c.bottom
-                self.vy = 0
+        if resolve_y(g.level, self.rect, self.vy):
+            self.vy = 0
 
-    def draw(self, g, s, cx):
+    def draw_pair(self, g, cx):
         sprite_name = 'koopa'
-        sprite = g.tiles.sprite(sprite_name)
-        if not self.in_shell and self.vx < 0:
-            sprite = pygame.transform.flip(sprite, True, False)
-        s.blit(sprite, (self.rect.x - cx, self.rect.y))
+        sprite = g.tiles.sprite_dir(sprite_name, self.in_shell or self.vx >= 0)
+        return sprite, (self.rect.x - cx, self.rect.y)
 
 class Fireball(Entity):
     def __init__(self, x, y, direction):
@@ -717,44 +844,36 @@ class Fireball(Entity):
         
         # Bounce on ground
         on_ground = False
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if self.vy > 0 and self.rect.bottom > c.top:
-                self.rect.bottom = c.top
-                self.vy = -abs(self.vy) * 0.7  # Bounce
-                self.bounces += 1
-                on_ground = True
+        if self.vy > 0 and resolve_y(g.level, self.rect, self.vy):
+            self.vy = -abs(self.vy) * 0.7  # Bounce
+            self.bounces += 1
+            on_ground = True
                 
-        # Wall collision
-        for gx,gy in g.level.solid_cells(self.rect):
-            c = rect_from_grid(gx,gy)
-            if abs(self.vx) > 0:
-                if self.vx > 0 and self.rect.right > c.left:
-                    self.remove = True
-                elif self.vx < 0 and self.rect.left < c.right:
-                    self.remove = True
+        # Wall collision: still overlapping a solid cell while moving
+        if self.vx and g.level.solid_boxes(self.rect):
+            self.remove = True
         
         # Remove after too many bounces or out of screen
         if self.bounces > 3 or self.rect.y > BASE_H or abs(self.rect.x - g.camera_x) > BASE_W + 100:
             self.remove = True
             
         # Check enemy collisions
-        for enemy in g.enemies[:]:
+        for enemy in g.enemies_near(self.rect):
             if self.rect.colliderect(enemy.rect):
                 enemy.remove = True
                 self.remove = True
                 g.player.score += 200
 
-    def draw(self, g, s, cx):
+    def draw_pair(self, g, cx):
         sprite = g.tiles.sprite('fireball')
-        s.blit(sprite, (self.rect.x - cx, self.rect.y))
+        return sprite, (self.rect.x - cx, self.rect.y)
 
 # ============================================================
 # ENHANCED GAME CLASS WITH SMB1 FEATURES
 # ============================================================
 class Game:
     def __init__(self, world=1, stage=1, marathon=False, carry=None):
-        self.tiles = Tileset()
+        self.tiles = get_tileset()
         self.world = world
         self.stage = stage
         self.marathon = marathon
@@ -769,6 +888,7 @@ class Game:
                 self.enemies.append(Goomba(x, y))
             else:  # 30% chance for koopa
                 self.enemies.append(Koopa(x, y))
+        self._bucket_enemies()
                 
         self.camera_x = 0
         self.time = START_TIME
@@ -783,13 +903,20 @@ class Game:
             self.player.powerup = carry.get("powerup", self.player.powerup)
 
     def _make_level(self, w, s):
-        return Level(LEVELS.get((w,s), basic_ground()))
+        return Level(LEVEL_TILES.get((w,s)) or encode_rows(basic_ground()))
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE]:
+        # One keyboard read per frame; the player gets it as a bit mask
+        keys = get_pressed()
+        if keys[K_ESCAPE]:
             self.player.lives = -999  # Sentinel to exit to menu
             return
+        self.input_bits = (
+            (IN_LEFT if keys[K_LEFT] else 0)
+            | (IN_RIGHT if keys[K_RIGHT] else 0)
+            | (IN_JUMP if keys[K_SPACE] else 0)
+            | (IN_ACTION if keys[K_z] or keys[K_x] else 0)
+            | (IN_RUN if keys[K_LSHIFT] or keys[K_RSHIFT] else 0))
 
         if self.cleared:
             self.clear_timer -= dt
@@ -804,6 +931,7 @@ class Game:
             e.update(self, dt)
             if e.remove:
                 self.enemies.remove(e)
+        self._bucket_enemies()
 
         self.camera_x = max(0, self.player.rect.centerx - BASE_W // 2)
         self.camera_x = min(self.camera_x, self.level.w * TILE - BASE_W)
@@ -811,15 +939,13 @@ class Game:
         self.time -= dt
 
         # Goal touch
-        for goal in self.level.goal_rects:
-            if self.player.rect.colliderect(goal):
-                self.cleared = True
-                self.clear_timer = 2.0  # Longer celebration
-                # Time bonus
-                self.player.score += max(0, int(self.time)) * 10
-                # Level clear bonus
-                self.player.score += 1000
-                break
+        if self.player.rect.collidelist(self.level.goal_rects) != -1:
+            self.cleared = True
+            self.clear_timer = 2.0  # Longer celebration
+            # Time bonus
+            self.player.score += max(0, int(self.time)) * 10
+            # Level clear bonus
+            self.player.score += 1000
 
         # Time up or death
         if self.time <= 0 or self.player.dead:
@@ -830,6 +956,24 @@ class Game:
                 # Game over
                 pass
 
+    def _bucket_enemies(self):
+        # Enemies by 64px cell of their center, rebuilt once they've moved;
+        # next frame's stomp and fireball checks only look at nearby cells
+        grid = {}
+        for e in self.enemies:
+            grid.setdefault((e.rect.centerx >> 6, e.rect.centery >> 6), []).append(e)
+        self.enemy_grid = grid
+
+    def enemies_near(self, r):
+        """Enemies that can overlap r. None is bigger than 16x24, so every
+        hit has its center within 32px of r"""
+        grid = self.enemy_grid
+        found = []
+        for cy in range((r.top - 32) >> 6, ((r.bottom + 32) >> 6) + 1):
+            for cx in range((r.left - 32) >> 6, ((r.right + 32) >> 6) + 1):
+                found.extend(grid.get((cx, cy), ()))
+        return found
+
     def _reload_current(self):
         carry = {
             "lives": self.player.lives, 
@@ -870,186 +1014,248 @@ class Game:
         start_x = self.camera_x // TILE
         end_x = start_x + (BASE_W // TILE) + 2
         
-        for y in range(self.level.h):
-            for x in range(start_x, min(end_x, self.level.w)):
-                ch = self.level.tile(x, y)
-                if ch != ' ':
-                    s.blit(self.tiles.tile(ch), (x * TILE - self.camera_x, y * TILE))
+        # Tiles, then enemies, player and fireballs, collected into one list
+        # and handed to a single blits() call
+        blit_list = []
+        tile = self.tiles.tile
+        level = self.level
+        end_x = min(end_x, level.w)
+        # No vertical scrolling: rows below the screen are never visible
+        end_y = min(level.h, BASE_H // TILE + 1)
+        for y in range(end_y):
+            # only the row's actual tiles in [start_x, end_x)
+            xs = level.row_xs[y]
+            chs = level.row_chs[y]
+            py = y * TILE
+            for i in range(bisect_left(xs, start_x), bisect_left(xs, end_x)):
+                blit_list.append((tile(chs[i]), (xs[i] * TILE - self.camera_x, py)))
         
-        # Draw entities
-        for e in self.enemies:
-            e.draw(self, s, self.camera_x)
-        self.player.draw(self, s, self.camera_x)
+        # Entities, in the order they used to be drawn
+        for e in (*self.enemies, self.player, *self.player.fireballs):
+            pair = e.draw_pair(self, self.camera_x)
+            if pair:
+                blit_list.append(pair)
+        s.blits(blit_list, False)
 
     def draw(self, s):
         self.draw_level(s)
         self._draw_hud_smb1(s)
         
         if self.cleared:
-            t = self.tiles.font_big.render("LEVEL CLEAR!", 1, self.tiles.c['yellow'])
+            t = self.tiles.text(self.tiles.font_big, "LEVEL CLEAR!", self.tiles.c.yellow)
             s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H//2 - 20))
             
             # Score display
-            t = self.tiles.font_hud.render(f"Score: {self.player.score}", 1, self.tiles.c['white'])
+            t = self.tiles.text(self.tiles.font_hud, f"Score: {self.player.score}", self.tiles.c.white)
             s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H//2))
 
     def _draw_hud_smb1(self, s):
         c = self.tiles.c
-        # Top HUD bar
-        pygame.draw.rect(s, c['black'], (0,0,BASE_W,16))
+        text = self.tiles.text
+        font = self.tiles.font_hud
+        # Top HUD bar and its MARIO / WORLD / TIME labels
+        s.blit(self.tiles.hud_static, (0, 0))
         
         # Mario
-        t = self.tiles.font_hud.render(f"MARIO", 1, c['white'])
-        s.blit(t, (8, 2))
-        t = self.tiles.font_hud.render(f"{self.player.score:06d}", 1, c['white'])
+        t = text(font, f"{self.player.score:06d}", c.white)
         s.blit(t, (8, 10))
         
         # Coins
-        t = self.tiles.font_hud.render(f"COIN x {self.player.coins:02d}", 1, c['white'])
+        t = text(font, f"COIN x {self.player.coins:02d}", c.white)
         s.blit(t, (BASE_W//2 - 30, 10))
         
         # World
-        t = self.tiles.font_hud.render(f"WORLD", 1, c['white'])
-        s.blit(t, (BASE_W - 80, 2))
-        t = self.tiles.font_hud.render(f"{self.world}-{self.stage}", 1, c['white'])
+        t = text(font, f"{self.world}-{self.stage}", c.white)
         s.blit(t, (BASE_W - 70, 10))
         
         # Time
-        t = self.tiles.font_hud.render(f"TIME", 1, c['white'])
-        s.blit(t, (BASE_W - 30, 2))
-        t = self.tiles.font_hud.render(f"{int(max(0,self.time)):03d}", 1, c['white'])
+        t = text(font, f"{int(max(0,self.time)):03d}", c.white)
         s.blit(t, (BASE_W - 30, 10))
         
         # Lives (bottom left)
-        t = self.tiles.font_hud.render(f"LIVES: {self.player.lives}", 1, c['white'])
+        t = text(font, f"LIVES: {self.player.lives}", c.white)
         s.blit(t, (8, BASE_H - 12))
 
 # ============================================================
 # MENU SYSTEM
 # ============================================================
 class Menu:
+    # Arrow key -> (world step, stage step)
+    MOVES = {K_UP: (-1, 0), K_DOWN: (1, 0), K_LEFT: (0, -1), K_RIGHT: (0, 1)}
+    # consume_result() modes
+    STAY, MARATHON, SINGLE = 0, 1, 2
+
     def __init__(self, tiles):
         self.tiles = tiles
         self.selected_world = 1
         self.selected_stage = 1
-        self.last_input_time = 0
         self.blink_timer = 0
+        self.result = (Menu.STAY, 0, 0)
+        # The last rendered menu; redrawn only when the selection moves or
+        # the highlight blinks, every other frame is one blit of this
+        self.frame = pygame.Surface((BASE_W, BASE_H)).convert()
+        self.blink_on = True
+        self.dirty = True
         
-    def update(self, dt):
-        current_time = time.time()
-        if current_time - self.last_input_time < 0.15:
-            return None
-            
-        keys = pygame.key.get_pressed()
-        changed = False
+        # Every label the menu shows, rendered once
+        c = tiles.c
+        font = tiles.font_hud
+        title = tiles.text(tiles.font_big, GAME_TITLE, c.white)
+        # Fixed grid layout: (world, stage) -> label position, in draw order
+        self.grid_pos = {(w, stage): (30 + (stage-1)*55, 75 + (w-1)*20)
+                         for w in range(1,9) for stage in range(1,5)}
+        self.label_yellow = {ws: tiles.text(font, f"{ws[0]}-{ws[1]}", c.yellow)
+                             for ws in self.grid_pos}
         
-        if keys[pygame.K_UP]:
-            self.selected_world = max(1, self.selected_world - 1)
-            changed = True
-        if keys[pygame.K_DOWN]:
-            self.selected_world = min(8, self.selected_world + 1)
-            changed = True
-        if keys[pygame.K_LEFT]:
-            self.selected_stage = max(1, self.selected_stage - 1)
-            changed = True
-        if keys[pygame.K_RIGHT]:
-            self.selected_stage = min(4, self.selected_stage + 1)
-            changed = True
-            
-        if changed: 
-            self.last_input_time = current_time
-            
-        # ENTER = marathon play (all levels)
-        if keys[pygame.K_RETURN] or keys[pygame.K_KP_ENTER]:
-            self.last_input_time = current_time
-            return "MARATHON"
-            
-        # SPACE = single level (selected)
-        if keys[pygame.K_SPACE]:
-            self.last_input_time = current_time
-            return (self.selected_world, self.selected_stage)
+        # Sky, title, every cell in white and the instructions never change:
+        # baked into one background, in a single blits() call
+        blit_seq = [(tiles.sky(), (0,0)), (title, (BASE_W//2 - title.get_width()//2, 30))]
+        for ws, pos in self.grid_pos.items():
+            blit_seq.append((tiles.text(font, f"{ws[0]}-{ws[1]}", c.white), pos))
+        for txt, color, y in (("SELECT WORLD WITH ARROWS", c.yellow, BASE_H - 80),
+                              ("ENTER: PLAY ALL LEVELS (1-1 → 8-4)", c.white, BASE_H - 60),
+                              ("SPACE: PLAY SELECTED LEVEL", c.white, BASE_H - 45),
+                              ("ESC: QUIT", c.white, BASE_H - 30)):
+            t = tiles.text(font, txt, color)
+            blit_seq.append((t, (BASE_W//2 - t.get_width()//2, y)))
+        self.static_bg = pygame.Surface((BASE_W, BASE_H)).convert()
+        self.static_bg.blits(blit_seq, False)
+        
+    def update(self, events, dt):
+        # Blinking selection, timed by dt so it keeps pace at any frame rate
+        self.blink_timer += dt * BLINK_RATE
+        blink_on = int(self.blink_timer) % 2 == 0
+        if blink_on != self.blink_on:
+            self.blink_on = blink_on
+            self.dirty = True
             
-        return None
+        # KEYDOWN fires once per press, so no debounce timer is needed
+        for event in events:
+            if event.type != KEYDOWN:
+                continue
+            key = event.key
+            move = self.MOVES.get(key)
+            if move:
+                self.selected_world = max(1, min(8, self.selected_world + move[0]))
+                self.selected_stage = max(1, min(4, self.selected_stage + move[1]))
+                self.dirty = True
+                
+            # ENTER = marathon play (all levels)
+            elif key == K_RETURN or key == K_KP_ENTER:
+                self.result = (Menu.MARATHON, 1, 1)
+                return
+                
+            # SPACE = single level (selected)
+            elif key == K_SPACE:
+                self.result = (Menu.SINGLE, self.selected_world, self.selected_stage)
+                return
+                
+    def consume_result(self):
+        """(mode, world, stage) picked since the last call; mode is STAY if none"""
+        result = self.result
+        self.result = (Menu.STAY, 0, 0)
+        return result
         
     def draw(self, s):
-        s.blit(self.tiles.sky(), (0,0))
-        
-        # Title
-        t = self.tiles.font_big.render(GAME_TITLE, 1, self.tiles.c['white'])
-        s.blit(t, (BASE_W//2 - t.get_width()//2, 30))
-        
-        # World selection grid
-        for w in range(1,9):
-            for stage in range(1,5):
-                if w == self.selected_world and stage == self.selected_stage:
-                    color = self.tiles.c['yellow']
-                    # Blinking selection
-                    self.blink_timer += 0.1
-                    if int(self.blink_timer) % 2 == 0:
-                        pygame.draw.rect(s, self.tiles.c['yellow'], 
-                                       (30 + (stage-1)*55 - 2, 75 + (w-1)*20 - 2, 54, 18), 1)
-                else:
-                    color = self.tiles.c['white']
-                    
-                t = self.tiles.font_hud.render(f"{w}-{stage}", 1, color)
-                x = 30 + (stage-1)*55
-                y = 75 + (w-1)*20
-                s.blit(t, (x, y))
-        
-        # Instructions
-        t = self.tiles.font_hud.render("SELECT WORLD WITH ARROWS", 1, self.tiles.c['yellow'])
-        s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H - 80))
+        if self.dirty:
+            self._render(self.frame)
+            self.dirty = False
+        s.blit(self.frame, (0, 0))
         
-        t = self.tiles.font_hud.render("ENTER: PLAY ALL LEVELS (1-1 → 8-4)", 1, self.tiles.c['white'])
-        s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H - 60))
+    def _render(self, s):
+        s.blit(self.static_bg, (0,0))
         
-        t = self.tiles.font_hud.render("SPACE: PLAY SELECTED LEVEL", 1, self.tiles.c['white'])
-        s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H - 45))
+        # Selected cell: put the sky back under its white label, then the
+        # yellow one on top
+        sel = (self.selected_world, self.selected_stage)
+        label = self.label_yellow[sel]
+        x, y = self.grid_pos[sel]
+        area = label.get_rect(topleft=(x, y))
+        s.blit(self.tiles.sky(), area, area)
+        s.blit(label, area)
         
-        t = self.tiles.font_hud.render("ESC: QUIT", 1, self.tiles.c['white'])
-        s.blit(t, (BASE_W//2 - t.get_width()//2, BASE_H - 30))
+        if self.blink_on:
+            pygame.draw.rect(s, self.tiles.c.yellow, (x - 2, y - 2, 54, 18), 1)
 
 # ============================================================
 # UTILITY FUNCTIONS
 # ============================================================
-def clamp(v, lo, hi): 
-    return max(lo, min(hi, v))
-    
 def rect_from_grid(gx, gy): 
+    """Level-load helper (goal and pipe rects). Per-frame collision code
+    works on the tuples from Level.solid_boxes instead of building Rects"""
     return pygame.Rect(gx*TILE, gy*TILE, TILE, TILE)
 
+def resolve_x(level, r, vx):
+    """Push r out of the first solid cell it ran into moving at vx.
+    Returns True on a hit; every entity's horizontal pass goes through here"""
+    if vx > 0:
+        for left,top,right,bottom in level.solid_boxes(r):
+            if r.right > left:
+                r.right = left
+                return True
+    elif vx < 0:
+        for left,top,right,bottom in level.solid_boxes(r):
+            if r.left < right:
+                r.left = right
+                return True
+    return False
+
+def resolve_y(level, r, vy):
+    """Vertical counterpart of resolve_x; returns the (gx, gy) cell hit, or None"""
+    if vy > 0:
+        for left,top,right,bottom in level.solid_boxes(r):
+            if r.bottom > top:
+                r.bottom = top
+                return left>>TILE_SHIFT, top>>TILE_SHIFT
+    elif vy < 0:
+        for left,top,right,bottom in level.solid_boxes(r):
+            if r.top < bottom:
+                r.top = bottom
+                return left>>TILE_SHIFT, top>>TILE_SHIFT
+    return None
+
 # ============================================================
 # MAIN GAME LOOP
 # ============================================================
 def main():
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    # SDL scales the BASE_W x BASE_H frame up to the window itself
+    screen = pygame.display.set_mode((BASE_W, BASE_H), pygame.SCALED)
     pygame.display.set_caption(GAME_TITLE + " - Complete SMB1 Recreation")
     clock = pygame.time.Clock()
 
-    tiles = Tileset()
+    tiles = get_tileset()
     menu = Menu(tiles)
     state = 'menu'
     game = None
     running = True
+    # One frame buffer in the display's format; menu and game both start
+    # with a full sky blit, so it never needs clearing
+    base_surf = pygame.Surface((BASE_W, BASE_H)).convert()
+
+    # Per-frame calls bound to locals once, out of the loop's global lookups
+    tick = clock.tick
+    event_get = pygame.event.get
+    event_clear = pygame.event.clear
+    present = screen.blit
+    flip = pygame.display.flip
 
     while running:
-        dt = clock.tick(FPS) / 1000.0
+        dt = tick(MENU_FPS if state == 'menu' else FPS) / 1000.0
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-        base_surf = pygame.Surface((BASE_W, BASE_H))
+        # Only QUIT and KEYDOWN are read; the rest (mouse motion, window
+        # events, key-ups) are dropped without becoming Event objects.
+        # Held keys come from get_pressed(), which the pump keeps current
+        if event_get(QUIT):
+            running = False
+        events = event_get(KEYDOWN, pump=False)
+        event_clear(pump=False)
 
         if state == 'menu':
-            selected = menu.update(dt)
-            if selected == "MARATHON":
-                game = Game(1, 1, marathon=True)
-                state = 'game'
-            elif isinstance(selected, tuple):
-                world, stage = selected
-                game = Game(world, stage, marathon=False)
+            menu.update(events, dt)
+            mode, world, stage = menu.consume_result()
+            if mode:
+                game = Game(world, stage, marathon=(mode == Menu.MARATHON))
                 state = 'game'
             menu.draw(base_surf)
 
@@ -1061,8 +1267,8 @@ def main():
             if game.player.lives <= 0 or game.player.lives == -999:
                 state = 'menu'
 
-        screen.blit(pygame.transform.scale(base_surf, (SCREEN_W, SCREEN_H)), (0, 0))
-        pygame.display.flip()
+        present(base_surf, (0, 0))
+        flip()
 
 if __name__ == "__main__":
     main()
@@ -24,6 +24,7 @@ Notes
 
 import sys
 import math
+import functools
 import pygame
 
 # --------------------------- Configuration --------------------------- #
@@ -33,9 +34,6 @@ BASE_W_T   = 20              # base render width in tiles
 BASE_H_T   = 15              # base render height in tiles
 BASE_W     = BASE_W_T * TILE # base render width in pixels (logical)
 BASE_H     = BASE_H_T * TILE # base render height in pixels (logical)
-SCALE      = 3               # screen upscaling factor
-SCREEN_W   = BASE_W * SCALE
-SCREEN_H   = BASE_H * SCALE
 FPS        = 60
 
 GRAVITY    = 0.35            # downward acceleration per frame
@@ -48,6 +46,13 @@ JUMP_V     = 6.2             # jump velocity (set vertically)
 PLAYER_W   = 12              # player collision box size
 PLAYER_H   = 14
 
+# Held-key bits, kept up to date from KEYDOWN/KEYUP and passed to Player.update.
+# Both jump keys get their own bit so letting go of one doesn't cancel the other.
+IN_LEFT, IN_RIGHT, IN_JUMP_Z, IN_JUMP_SPACE = 1, 2, 4, 8
+IN_JUMP    = IN_JUMP_Z | IN_JUMP_SPACE
+KEY_BITS   = {pygame.K_LEFT: IN_LEFT, pygame.K_RIGHT: IN_RIGHT,
+              pygame.K_z: IN_JUMP_Z, pygame.K_SPACE: IN_JUMP_SPACE}
+
 # Colors (RGB)
 COL_BG     = (107, 140, 255)
 COL_GROUND = (155, 118, 83)
@@ -67,18 +72,35 @@ COL_WHITE = (255, 255, 255)  # Text
 
 # --------------------------- Utility Helpers ------------------------ #
 
-def clamp(value, lo, hi):
-    return lo if value < lo else hi if value > hi else value
-
 def sign(x: float) -> int:
     return -1 if x < 0 else (1 if x > 0 else 0)
 
 # --------------------------- Level Generation ----------------------- #
 
-SOLIDS = set(['X', '#', 'P', '?'])  # tiles that are solid
-COINS  = set(['o'])                 # tiles that are coins
-GOAL   = 'F'                        # goal tile (flag)
-SPAWN  = 'S'                        # spawn marker
+# Tile codes: one byte per cell, the old map characters as their byte values
+EMPTY, GROUND, BRICK, QBLK, PIPE, COIN, GOAL, SPAWN = b" X#?PoFS"
+# GOAL is the flag, SPAWN the player's start marker
+
+# tile byte -> 1 if solid; indexing this replaces set membership tests
+SOLID_MASK = bytes(c in b"X#P?" for c in range(256))
+# tiles drawn once into the level's background surface; the rest
+# (question blocks, coins) are drawn per frame
+STATIC_TILES = frozenset((GROUND, BRICK, PIPE, GOAL))
+
+# The sin shapes are the same for every level: computed once at import
+HILL_BUMP = tuple((dx, int(1.5 * math.sin(dx / 6.0 * math.pi))) for dx in range(-6, 6))
+ARC_RISE  = tuple(int(3 * math.sin(k / 6.0 * math.pi)) for k in range(7))
+
+def fill_cells(g, x0, y0, x1, y1, t):
+    """Set cells [x0, x1) x [y0, y1) of grid g to tile t, one slice write per
+    row. Columns are clipped to the grid so rows never change length."""
+    x0 = max(x0, 0)
+    x1 = min(x1, len(g[0]))
+    if x1 <= x0:
+        return
+    run = bytes((t,)) * (x1 - x0)
+    for y in range(y0, y1):
+        g[y][x0:x1] = run
 
 class Level:
     """
@@ -91,74 +113,72 @@ class Level:
         # widen a bit as levels progress (kept reasonable for performance)
         self.w = 180 + (level_index % 6) * 10
         self.grid = self._generate(level_index)
+        # per-row 0/1 solidity, kept in step with grid by set_tile
+        self.solid_rows = [row.translate(SOLID_MASK) for row in self.grid]
         self.spawn_px = self._find_spawn()
         self.enemies = self._spawn_enemies()
-        # precompute solid rect cache for faster collision in the visible band
-        self._solid_rect_cache = {}
+        # the enemies' own Rects, index-aligned with enemies, for collidelistall()
+        self.enemy_rects = [e.rect for e in self.enemies]
+        # one Rect per cell, built once and handed out by rects_near; the
+        # physics only reads them, so they're never copied or rebuilt
+        self.rect_rows = [[pygame.Rect(tx * TILE, ty * TILE, TILE, TILE) for tx in range(self.w)]
+                          for ty in range(self.h)]
+        # static tiles pre-drawn at full level size; built on first draw
+        self.bg_surf = None
 
     def _generate(self, i: int):
         w, h = self.w, self.h
-        g = [[' ' for _ in range(w)] for _ in range(h)]
+        g = [bytearray(b" " * w) for _ in range(h)]
 
         ground_y = h - 2
 
         # 1) Flat ground, then carve holes to form simple platforming
-        for x in range(w):
-            for y in range(ground_y, h):
-                g[y][x] = 'X'
+        fill_cells(g, 0, ground_y, w, h, GROUND)
 
         # 2) Holes patterned by a sin curve and stride
         stride = 34 + (i % 7)
         for base in range(28, w - 25, stride):
             span = 2 + ((base + i * 7) % 3)  # 2..4 wide
             # lift ground locally using a small hill to preview the gap
-            for dx in range(-6, 6):
-                xx = clamp(base + dx, 0, w - 1)
-                bump = int(1.5 * math.sin(dx / 6.0 * math.pi))
+            for dx, bump in HILL_BUMP:
+                xx = base + dx
+                xx = 0 if xx < 0 else w - 1 if xx > w - 1 else xx
                 for y in range(ground_y - bump, h):
-                    g[y][xx] = 'X'
+                    g[y][xx] = GROUND
             # cut the hole itself
-            for xx in range(base, min(base + span, w - 1)):
-                for y in range(ground_y, h):
-                    g[y][xx] = ' '
+            fill_cells(g, base, ground_y, min(base + span, w - 1), h, EMPTY)
 
         # 3) Pipes
         for base in range(22, w - 40, 28 + (i % 3) * 5):
             height = 2 + ((base + i) % 3)  # 2..4
             top = ground_y - height
-            for y in range(top, ground_y):
-                if 0 <= base < w: g[y][base] = 'P'
-                if 0 <= base + 1 < w: g[y][base + 1] = 'P'
+            fill_cells(g, base, top, base + 2, ground_y, PIPE)
 
         # 4) Platforms of bricks and question blocks
         for base in range(12, w - 16, 18 + (i % 5)):
             plat_y = ground_y - 4 - (((base // 11) + i) % 3) * 2
             length = 4 + ((base + i) % 3)  # 4..6
-            for dx in range(length):
-                x = base + dx
-                if 0 <= x < w and 2 <= plat_y < ground_y - 1:
-                    g[plat_y][x] = '#'
+            if 2 <= plat_y < ground_y - 1:
+                fill_cells(g, base, plat_y, base + length, plat_y + 1, BRICK)
             # insert a question block near middle
             qx = base + length // 2
             if 0 <= qx < w and 2 <= plat_y - 1 < ground_y - 1:
-                g[plat_y - 1][qx] = '?'
+                g[plat_y - 1][qx] = QBLK
 
         # 5) Coin arcs
         for base in range(25, w - 10, 32):
-            for k in range(7):
+            for k, rise in enumerate(ARC_RISE):
                 xx = base + k
-                yy = ground_y - 4 - int(3 * math.sin(k / 6.0 * math.pi))
+                yy = ground_y - 4 - rise
                 if 0 <= xx < w and 2 <= yy < ground_y - 1:
-                    g[yy][xx] = 'o'
+                    g[yy][xx] = COIN
 
         # 6) Start position and Goal flag
         g[ground_y - 1][2] = SPAWN
         g[ground_y - 1][w - 4] = GOAL
 
         # Ensure the last stretch is safe (no hole right at the end)
-        for x in range(w - 8, w - 2):
-            for y in range(ground_y, h):
-                g[y][x] = 'X'
+        fill_cells(g, w - 8, ground_y, w - 2, h, GROUND)
 
         return g
 
@@ -176,7 +196,7 @@ class Level:
         ground_y = self.h - 2
         for x in range(8, self.w - 8, 14 + (self.index % 5)):
             # place only if ground is present and not a hole
-            if self.grid[ground_y][x] == 'X' and self.grid[ground_y][x + 1] == 'X':
+            if self.grid[ground_y][x] == GROUND and self.grid[ground_y][x + 1] == GROUND:
                 ex = (x + 0.2) * TILE
                 ey = (ground_y - 1) * TILE + (TILE - PLAYER_H)
                 enemies.append(Enemy(ex, ey))
@@ -188,32 +208,61 @@ class Level:
     def tile(self, tx, ty):
         if not self.in_bounds(tx, ty):
             # out-of-bounds above is empty; sides/below behave like solid to keep camera/physics stable
-            return 'X' if ty >= self.h else ' '
+            return GROUND if ty >= self.h else EMPTY
         return self.grid[ty][tx]
 
-    def set_tile(self, tx, ty, ch):
+    def set_tile(self, tx, ty, t):
         if self.in_bounds(tx, ty):
-            self.grid[ty][tx] = ch
-            # Invalidate cache for this column region
-            self._solid_rect_cache.clear()
-
-    def rects_near(self, rect: pygame.Rect):
-        """Return solid tile rects near the given rect to check collisions efficiently."""
-        key = (rect.left // TILE, rect.top // TILE, rect.right // TILE, rect.bottom // TILE)
-        if key in self._solid_rect_cache:
-            return self._solid_rect_cache[key]
-
+            old = self.grid[ty][tx]
+            self.grid[ty][tx] = t
+            self.solid_rows[ty][tx] = SOLID_MASK[t]
+            if self.bg_surf is not None and (t in STATIC_TILES or old in STATIC_TILES):
+                bake_tile(self.bg_surf, tx, ty, t)  # e.g. a used '?' turning to brick
+
+    def cell_span(self, rect: pygame.Rect, pad_x: int = 0, pad_y: int = 0):
+        """(tx0, tx1, ty0, ty1): the cells under rect, grown by pad_x/pad_y,
+        clamped to the grid."""
+        wmax, hmax = self.w - 1, self.h - 1
+        tx0 = rect.left // TILE - pad_x
+        tx1 = rect.right // TILE + pad_x
+        ty0 = rect.top // TILE - pad_y
+        ty1 = rect.bottom // TILE + pad_y
+        return (0 if tx0 < 0 else wmax if tx0 > wmax else tx0,
+                0 if tx1 < 0 else wmax if tx1 > wmax else tx1,
+                0 if ty0 < 0 else hmax if ty0 > hmax else ty0,
+                0 if ty1 < 0 else hmax if ty1 > hmax else ty1)
+
+    def consume_region(self, tx0, tx1, ty0, ty1):
+        """Collect every coin in the (clamped) cell window and report whether
+        it touches the goal, in one pass over its rows: (coins, goal_hit)."""
+        coins = 0
+        goal_hit = False
+        for ty in range(ty0, ty1 + 1):
+            row = self.grid[ty]
+            tx = row.find(COIN, tx0, tx1 + 1)
+            while tx >= 0:
+                self.set_tile(tx, ty, EMPTY)
+                coins += 1
+                tx = row.find(COIN, tx + 1, tx1 + 1)
+            if not goal_hit and row.find(GOAL, tx0, tx1 + 1) >= 0:
+                goal_hit = True
+        return coins, goal_hit
+
+    def rects_near(self, rect: pygame.Rect, pad_y: int = 1):
+        """Return solid tile rects near the given rect to check collisions efficiently.
+        pad_y=2 also covers the rect after a vertical move of under one tile,
+        so one list can serve both collision passes of a frame."""
         tiles = []
-        tx0 = clamp(rect.left // TILE - 1, 0, self.w - 1)
-        tx1 = clamp(rect.right // TILE + 1, 0, self.w - 1)
-        ty0 = clamp(rect.top // TILE - 1, 0, self.h - 1)
-        ty1 = clamp(rect.bottom // TILE + 1, 0, self.h - 1)
+        tx0, tx1, ty0, ty1 = self.cell_span(rect, 1, pad_y)
         for ty in range(ty0, ty1 + 1):
-            for tx in range(tx0, tx1 + 1):
-                ch = self.tile(tx, ty)
-                if ch in SOLIDS:
-                    tiles.append(pygame.Rect(tx * TILE, ty * TILE, TILE, TILE))
-        self._solid_rect_cache[key] = tiles
+            # window is clamped in bounds; find() jumps between solid cells
+            # and skips empty rows in one C call
+            seg = self.solid_rows[ty][tx0:tx1 + 1]
+            rects = self.rect_rows[ty]
+            i = seg.find(1)
+            while i >= 0:
+                tiles.append(rects[tx0 + i])
+                i = seg.find(1, i + 1)
         return tiles
 
 # --------------------------- Entities -------------------------------- #
@@ -232,6 +281,7 @@ class Player:
         self.dead = False
         self.invuln_timer = 0
         self.prev_bottom = self.rect.bottom
+        self.at_goal = False  # touched the flag this frame
 
     def respawn(self, px, py):
         self.x = float(px)
@@ -243,19 +293,20 @@ class Player:
         self.on_ground = False
         self.dead = False
         self.invuln_timer = 60
+        self.at_goal = False  # a respawn cancels a goal touch from before it
 
-    def update(self, level: Level, keys):
+    def update(self, level: Level, held: int):
         self.prev_bottom = self.rect.bottom
 
         # Input
         ax = 0.0
-        if keys[pygame.K_LEFT]:
+        if held & IN_LEFT:
             ax -= MOVE_ACC
-        if keys[pygame.K_RIGHT]:
+        if held & IN_RIGHT:
             ax += MOVE_ACC
         # accelerate
-        self.vx += ax
-        self.vx = clamp(self.vx, -MOVE_MAX, MOVE_MAX)
+        vx = self.vx + ax
+        self.vx = -MOVE_MAX if vx < -MOVE_MAX else MOVE_MAX if vx > MOVE_MAX else vx
         # friction when no input
         if ax == 0.0:
             self.vx *= FRICTION
@@ -263,17 +314,23 @@ class Player:
                 self.vx = 0.0
 
         # Jump
-        if (keys[pygame.K_z] or keys[pygame.K_SPACE]) and self.on_ground:
+        if held & IN_JUMP and self.on_ground:
             self.vy = -JUMP_V
             self.on_ground = False
 
         # Gravity
-        self.vy = clamp(self.vy + GRAVITY, -99, MAX_FALL)
+        vy = self.vy + GRAVITY
+        self.vy = -99 if vy < -99 else MAX_FALL if vy > MAX_FALL else vy
 
-        # Horizontal movement & collisions
+        # Horizontal movement & collisions. collidelist() finds the first
+        # overlap in C; tiles before it can't collide, so the Python loop
+        # (which moves the rect as it goes) only starts there, if at all
         self.x += self.vx
         self.rect.x = int(self.x)
-        for tile_rect in level.rects_near(self.rect):
+        # one query serves both passes: |vy| stays under a tile per frame
+        tiles = level.rects_near(self.rect, 2)
+        hit = self.rect.collidelist(tiles)
+        for tile_rect in tiles[hit:] if hit >= 0 else ():
             if self.rect.colliderect(tile_rect):
                 if self.vx > 0:
                     self.rect.right = tile_rect.left
@@ -289,7 +346,8 @@ class Player:
         bumped_head = False
         head_bump_tiles = []
 
-        for tile_rect in level.rects_near(self.rect):
+        hit = self.rect.collidelist(tiles)
+        for tile_rect in tiles[hit:] if hit >= 0 else ():
             if self.rect.colliderect(tile_rect):
                 tx = tile_rect.x // TILE
                 ty = tile_rect.y // TILE
@@ -310,24 +368,15 @@ class Player:
         # Handle head bumps: question blocks create a coin; bricks stay solid
         if bumped_head:
             for (tx, ty) in head_bump_tiles:
-                ch = level.tile(tx, ty)
-                if ch == '?':
+                if level.tile(tx, ty) == QBLK:
                     # convert to a used block and spawn a coin one tile above if empty
-                    level.set_tile(tx, ty, '#')
-                    if level.tile(tx, ty - 1) == ' ':
-                        level.set_tile(tx, ty - 1, 'o')
-
-        # Coin collection and goal check
-        tx0 = clamp(self.rect.left // TILE, 0, level.w - 1)
-        tx1 = clamp(self.rect.right // TILE, 0, level.w - 1)
-        ty0 = clamp(self.rect.top // TILE, 0, level.h - 1)
-        ty1 = clamp(self.rect.bottom // TILE, 0, level.h - 1)
-        for ty in range(ty0, ty1 + 1):
-            for tx in range(tx0, tx1 + 1):
-                ch = level.tile(tx, ty)
-                if ch in COINS:
-                    level.set_tile(tx, ty, ' ')
-                    self.coins += 1
+                    level.set_tile(tx, ty, BRICK)
+                    if level.tile(tx, ty - 1) == EMPTY:
+                        level.set_tile(tx, ty - 1, COIN)
+
+        # Coin collection and goal check; Game.run acts on at_goal
+        coins, self.at_goal = level.consume_region(*level.cell_span(self.rect))
+        self.coins += coins
 
         # Fell into void?
         if self.rect.top > level.h * TILE + TILE * 2:
@@ -346,6 +395,8 @@ class Player:
 
 class Enemy:
     """Simple walking enemy that turns at edges and walls."""
+    __slots__ = ("x", "y", "vx", "vy", "rect", "alive")
+
     def __init__(self, px, py):
         self.x = float(px)
         self.y = float(py)
@@ -358,21 +409,25 @@ class Enemy:
         if not self.alive:
             return
         # gravity
-        self.vy = clamp(self.vy + GRAVITY, -99, MAX_FALL)
+        vy = self.vy + GRAVITY
+        self.vy = -99 if vy < -99 else MAX_FALL if vy > MAX_FALL else vy
 
         # try to keep walking; detect edge
         ahead_x = self.rect.centerx + (8 * sign(self.vx))
         foot_y  = self.rect.bottom + 1
-        tx = clamp(ahead_x // TILE, 0, level.w - 1)
-        ty = clamp(foot_y // TILE, 0, level.h - 1)
-        under = level.tile(tx, ty)
-        if under not in SOLIDS:
+        tx = ahead_x // TILE
+        ty = foot_y // TILE
+        tx = 0 if tx < 0 else level.w - 1 if tx >= level.w else tx
+        ty = 0 if ty < 0 else level.h - 1 if ty >= level.h else ty
+        if not SOLID_MASK[level.tile(tx, ty)]:
             self.vx *= -1
 
-        # Horizontal
+        # Horizontal (same first-hit skip and shared tile query as the player)
         self.x += self.vx
         self.rect.x = int(self.x)
-        for tile_rect in level.rects_near(self.rect):
+        tiles = level.rects_near(self.rect, 2)
+        hit = self.rect.collidelist(tiles)
+        for tile_rect in tiles[hit:] if hit >= 0 else ():
             if self.rect.colliderect(tile_rect):
                 if self.vx > 0: self.rect.right = tile_rect.left
                 else:           self.rect.left  = tile_rect.right
@@ -382,7 +437,8 @@ class Enemy:
         # Vertical
         self.y += self.vy
         self.rect.y = int(self.y)
-        for tile_rect in level.rects_near(self.rect):
+        hit = self.rect.collidelist(tiles)
+        for tile_rect in tiles[hit:] if hit >= 0 else ():
             if self.rect.colliderect(tile_rect):
                 if self.vy > 0:
                     self.rect.bottom = tile_rect.top
@@ -396,56 +452,108 @@ class Enemy:
     def stomp(self):
         self.alive = False
 
-    def draw(self, surf, cam_x):
+    def draw_pair(self, cam_x):
+        """(surface, pos) for a blits() batch, or None when stomped."""
         if not self.alive:
-            return
-        r = pygame.Rect(self.rect.x - cam_x, self.rect.y, self.rect.w, self.rect.h)
-        pygame.draw.rect(surf, COL_ENEMY, r)
+            return None
+        return SPRITE_SURFS["enemy"], (self.rect.x - cam_x, self.rect.y)
 
 # --------------------------- Renderer -------------------------------- #
 
+# tile code -> (surface, offset from the cell's top-left), filled by
+# build_tile_surfs() once the display exists
+TILE_SURFS = {}
+# name -> surface for the moving things, filled alongside TILE_SURFS
+SPRITE_SURFS = {}
+
+def build_tile_surfs():
+    """Pre-render every drawable tile once, in the display's pixel format."""
+    cell = pygame.Rect(0, 0, TILE, TILE)
+    for t, col in ((GROUND, COL_GROUND), (BRICK, COL_BLOCK), (QBLK, COL_QBLK), (PIPE, COL_PIPE)):
+        s = pygame.Surface((TILE, TILE)).convert()
+        s.fill(col)
+        if t != GROUND:
+            pygame.draw.rect(s, (0,0,0), cell, 1)
+        TILE_SURFS[t] = (s, (0, 0))
+
+    s = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
+    pygame.draw.circle(s, COL_COIN, (TILE // 2, TILE // 2), TILE // 3)
+    TILE_SURFS[COIN] = (s.convert_alpha(), (0, 0))
+
+    # flag pole and flag; reaches 8px above its cell and past its right edge
+    s = pygame.Surface((TILE + 3, TILE + 8), pygame.SRCALPHA)
+    pygame.draw.rect(s, COL_FLAG, (0, 0, 3, TILE + 8))
+    pygame.draw.rect(s, COL_FLAG2, (3, 10, TILE, TILE // 2))
+    TILE_SURFS[GOAL] = (s.convert_alpha(), (TILE // 2 - 1, -8))
+
+    s = pygame.Surface((14, 14)).convert()
+    s.fill(COL_ENEMY)
+    SPRITE_SURFS["enemy"] = s
+
+def build_level_bg(level: Level):
+    """Draw every static tile of the level once into level.bg_surf."""
+    bg = pygame.Surface((level.w * TILE, level.h * TILE)).convert()
+    bg.fill(COL_BG)
+    blit_list = []
+    for ty, row in enumerate(level.grid):
+        for tx, t in enumerate(row):
+            if t in STATIC_TILES:
+                img, (dx, dy) = TILE_SURFS[t]
+                blit_list.append((img, (tx * TILE + dx, ty * TILE + dy)))
+    bg.blits(blit_list, False)
+    level.bg_surf = bg
+
+def bake_tile(bg, tx, ty, t):
+    """Redraw one cell of a level background after set_tile changed it."""
+    x, y = tx * TILE, ty * TILE
+    bg.fill(COL_BG, (x, y, TILE, TILE))
+    if t in STATIC_TILES:
+        img, (dx, dy) = TILE_SURFS[t]
+        bg.blit(img, (x + dx, y + dy))
+
 def draw_level_tiles(surf, level: Level, cam_x: int):
-    """Draw only the visible slice of tiles."""
-    w_vis_tiles = BASE_W // TILE + 2 + 2 # margin
-    tx0 = clamp(cam_x // TILE - 1, 0, level.w - 1)
-    tx1 = clamp(tx0 + w_vis_tiles, 0, level.w - 1)
+    """Blit the visible slice of the static background, then the question
+    blocks and coins on top of it in one blits() call."""
+    if level.bg_surf is None:
+        build_level_bg(level)
+    surf.blit(level.bg_surf, (0, 0), (cam_x, 0, BASE_W, BASE_H))
 
-    for ty in range(level.h):
-        for tx in range(tx0, tx1 + 1):
-            ch = level.tile(tx, ty)
-            if ch == ' ':
-                continue
-            x = tx * TILE - cam_x
-            y = ty * TILE
-            r = pygame.Rect(x, y, TILE, TILE)
-            if ch == 'X':
-                pygame.draw.rect(surf, COL_GROUND, r)
-            elif ch == '#':
-                pygame.draw.rect(surf, COL_BLOCK, r)
-                pygame.draw.rect(surf, (0,0,0), r, 1)
-            elif ch == '?':
-                pygame.draw.rect(surf, COL_QBLK, r)
-                pygame.draw.rect(surf, (0,0,0), r, 1)
-            elif ch == 'P':
-                pygame.draw.rect(surf, COL_PIPE, r)
-                pygame.draw.rect(surf, (0,0,0), r, 1)
-            elif ch == 'o':
-                pygame.draw.circle(surf, COL_COIN, (x + TILE // 2, y + TILE // 2), TILE // 3)
-            elif ch == 'F':
-                # flag pole and flag
-                pole = pygame.Rect(x + TILE // 2 - 1, y - 8, 3, TILE + 8)
-                pygame.draw.rect(surf, COL_FLAG, pole)
-                flag = pygame.Rect(x + TILE // 2 + 2, y + 2, TILE, TILE // 2)
-                pygame.draw.rect(surf, COL_FLAG2, flag)
+    w_vis_tiles = BASE_W // TILE + 2 + 2 # margin
+    tx0 = cam_x // TILE - 1
+    tx0 = 0 if tx0 < 0 else level.w - 1 if tx0 >= level.w else tx0
+    tx1 = tx0 + w_vis_tiles  # tx0 is already >= 0
+    tx1 = level.w - 1 if tx1 >= level.w else tx1
+
+    blit_list = []
+    for ty, row in enumerate(level.grid):
+        y = ty * TILE
+        for t in (QBLK, COIN):
+            img = TILE_SURFS[t][0]
+            tx = row.find(t, tx0, tx1 + 1)
+            while tx >= 0:
+                blit_list.append((img, (tx * TILE - cam_x, y)))
+                tx = row.find(t, tx + 1, tx1 + 1)
+    surf.blits(blit_list, False)
 
 # --------------------------- Game Loop -------------------------------- #
 
+_fonts = {}  # id(font) -> Font, so the text cache can key on a plain int
+
+@functools.lru_cache(maxsize=256)
+def _render_text(font_id, s, color):
+    return _fonts[font_id].render(s, True, color).convert_alpha()
+
 class Game:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("Ultra Mario 2D Bros — 32 Levels")
-        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+        # SDL scales the BASE_W x BASE_H frame up to the window (SCALED)
+        self.screen = pygame.display.set_mode((BASE_W, BASE_H), pygame.SCALED)
+        # Keep SDL from queueing the rest (mouse motion, window events, ...)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
         self.base_surf = pygame.Surface((BASE_W, BASE_H)).convert()
+        build_tile_surfs()
         self.clock = pygame.time.Clock()
         self.big_font = pygame.font.SysFont("Arial", 20, bold=True)
         self.small_font = pygame.font.SysFont("Arial", 10)
@@ -456,6 +564,14 @@ class Game:
         self.player = Player(*self.level.spawn_px)
 
         self.state = "menu"  # menu | play | win | gameover
+        self.held = 0  # IN_* bits of the keys currently down
+
+    def text(self, font, s, color):
+        # Rendered text by (font, string, color); the menu, HUD and end
+        # screens show the same strings frame after frame, while HUD lines
+        # with old coin counts age out of the LRU
+        _fonts.setdefault(id(font), font)
+        return _render_text(id(font), s, color)
 
     def reset_level(self):
         self.level = Level(self.level_no)
@@ -470,13 +586,20 @@ class Game:
 
     def handle_player_enemy_interactions(self):
         # Player vs Enemy interactions (stomp or hurt)
-        for e in self.level.enemies:
+        # collidelistall() finds the overlapping enemies in C; only those
+        # reach the Python stomp/hurt branch
+        stomped = False
+        enemies = self.level.enemies
+        for i in self.player.rect.collidelistall(self.level.enemy_rects):
+            e = enemies[i]
             if not e.alive:
                 continue
+            # re-check: a respawn earlier in this loop moves the player
             if self.player.rect.colliderect(e.rect):
                 # Stomp check: player was above and moving down
                 if self.player.prev_bottom <= e.rect.top and self.player.vy > 0:
                     e.stomp()
+                    stomped = True
                     self.player.vy = -JUMP_V * 0.7  # bounce
                     self.player.on_ground = False
                 else:
@@ -486,46 +609,50 @@ class Game:
                             self.state = "gameover"
                         else:
                             self.player.respawn(*self.level.spawn_px)
+        if stomped:
+            # drop the dead so update/draw/this loop stop walking past them
+            self.level.enemies = [e for e in enemies if e.alive]
+            self.level.enemy_rects = [e.rect for e in self.level.enemies]
 
     def draw_menu(self):
         self.base_surf.fill(COL_BG)
 
         # Top HUD
         hud_y = 10
-        mario_text = self.small_font.render("MARIO", True, COL_WHITE)
+        mario_text = self.text(self.small_font, "MARIO", COL_WHITE)
         self.base_surf.blit(mario_text, (20, hud_y))
-        score_text = self.small_font.render("000000", True, COL_WHITE)
+        score_text = self.text(self.small_font, "000000", COL_WHITE)
         self.base_surf.blit(score_text, (80, hud_y))
         pygame.draw.circle(self.base_surf, COL_COIN, (150, hud_y + 5), 4)
-        coin_count = self.small_font.render("x00", True, COL_WHITE)
+        coin_count = self.text(self.small_font, "x00", COL_WHITE)
         self.base_surf.blit(coin_count, (160, hud_y))
-        world_text = self.small_font.render("WORLD", True, COL_WHITE)
+        world_text = self.text(self.small_font, "WORLD", COL_WHITE)
         self.base_surf.blit(world_text, (200, hud_y))
-        level_text = self.small_font.render("1-1", True, COL_WHITE)
+        level_text = self.text(self.small_font, "1-1", COL_WHITE)
         self.base_surf.blit(level_text, (250, hud_y))
-        time_text = self.small_font.render("TIME", True, COL_WHITE)
+        time_text = self.text(self.small_font, "TIME", COL_WHITE)
         self.base_surf.blit(time_text, (280, hud_y))
 
         # Title sign
         sign_rect = pygame.Rect(60, 40, 200, 40)
         pygame.draw.rect(self.base_surf, COL_TITLE_BG, sign_rect)
         pygame.draw.rect(self.base_surf, COL_BLACK, sign_rect, 1)
-        title_upper = self.big_font.render("ULTRA", True, COL_WHITE)
+        title_upper = self.text(self.big_font, "ULTRA", COL_WHITE)
         self.base_surf.blit(title_upper, (sign_rect.centerx - title_upper.get_width() // 2, sign_rect.top + 2))
-        title_lower = self.big_font.render("MARIO 2D BROS.", True, COL_WHITE)
+        title_lower = self.text(self.big_font, "MARIO 2D BROS.", COL_WHITE)
         self.base_surf.blit(title_lower, (sign_rect.centerx - title_lower.get_width() // 2, sign_rect.top + 20))
 
         # Copyright
-        copy_text = self.small_font.render("©1985 © Samsoft 2025", True, COL_WHITE)
+        copy_text = self.text(self.small_font, "©1985 © Samsoft 2025", COL_WHITE)
         self.base_surf.blit(copy_text, (BASE_W // 2 - copy_text.get_width() // 2, 85))
 
         # Player options
         opt_y = 110
         mushroom_rect = pygame.Rect(100, opt_y, 8, 8)  # Simple mushroom icon
         pygame.draw.ellipse(self.base_surf, (255, 0, 0), mushroom_rect)
-        opt1_text = self.small_font.render("1 PLAYER GAME", True, COL_WHITE)
+        opt1_text = self.text(self.small_font, "1 PLAYER GAME", COL_WHITE)
         self.base_surf.blit(opt1_text, (110, opt_y))
-        opt2_text = self.small_font.render("2 PLAYER GAME", True, COL_WHITE)  # Placeholder, though not functional
+        opt2_text = self.text(self.small_font, "2 PLAYER GAME", COL_WHITE)  # Placeholder, though not functional
         self.base_surf.blit(opt2_text, (110, opt_y + 15))
 
         # Landscape
@@ -548,7 +675,7 @@ class Game:
         pygame.draw.rect(self.base_surf, COL_PLAYER, (mario_x, mario_y, 12, 14))  # Body
         pygame.draw.rect(self.base_surf, COL_PLAYER, (mario_x + 2, mario_y - 4, 8, 4))  # Hat
         # Top score
-        top_text = self.small_font.render("TOP- 000000", True, COL_WHITE)
+        top_text = self.text(self.small_font, "TOP- 000000", COL_WHITE)
         self.base_surf.blit(top_text, (160, ground_y - 20))
         # Brick ground
         for x in range(0, BASE_W, TILE):
@@ -561,7 +688,10 @@ class Game:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
+                elif event.type == pygame.KEYUP:
+                    self.held &= ~KEY_BITS.get(event.key, 0)
                 elif event.type == pygame.KEYDOWN:
+                    self.held |= KEY_BITS.get(event.key, 0)
                     if event.key == pygame.K_ESCAPE:
                         pygame.quit()
                         sys.exit(0)
@@ -575,30 +705,16 @@ class Game:
                         self.state = "menu"
                         self.reset_level()
 
-            keys = pygame.key.get_pressed()
-
             # Update
             if self.state == "play":
-                self.player.update(self.level, keys)
+                self.player.update(self.level, self.held)
                 for e in self.level.enemies:
                     e.update(self.level)
 
                 self.handle_player_enemy_interactions()
 
-                # Check for goal (touching tile 'F')
-                tx0 = clamp(self.player.rect.left // TILE, 0, self.level.w - 1)
-                tx1 = clamp(self.player.rect.right // TILE, 0, self.level.w - 1)
-                ty0 = clamp(self.player.rect.top // TILE, 0, self.level.h - 1)
-                ty1 = clamp(self.player.rect.bottom // TILE, 0, self.level.h - 1)
-                touched_goal = False
-                for ty in range(ty0, ty1 + 1):
-                    for tx in range(tx0, tx1 + 1):
-                        if self.level.tile(tx, ty) == GOAL:
-                            touched_goal = True
-                            break
-                    if touched_goal:
-                        break
-                if touched_goal:
+                # Goal (touching tile 'F'), found by the player's coin scan
+                if self.player.at_goal:
                     self.next_level()
 
                 if self.player.dead:
@@ -609,42 +725,46 @@ class Game:
                         self.player.respawn(*self.level.spawn_px)
 
             # Camera follows player (logical space)
-            cam_x = clamp(int(self.player.rect.centerx - BASE_W // 2), 0, self.level.w * TILE - BASE_W) if self.state == "play" else 0
+            cam_x = 0
+            if self.state == "play":
+                cam_x = int(self.player.rect.centerx - BASE_W // 2)
+                cam_max = self.level.w * TILE - BASE_W
+                cam_x = 0 if cam_x < 0 else cam_max if cam_x > cam_max else cam_x
 
-            # Draw to low-res buffer
-            self.base_surf.fill(COL_BG)
+            # Draw to low-res buffer (play covers it with the level background)
+            if self.state != "play":
+                self.base_surf.fill(COL_BG)
             if self.state == "menu":
                 self.draw_menu()
             elif self.state == "play":
                 draw_level_tiles(self.base_surf, self.level, cam_x)
-                # draw enemies
-                for e in self.level.enemies:
-                    e.draw(self.base_surf, cam_x)
+                # draw enemies, batched like the tiles
+                pairs = [e.draw_pair(cam_x) for e in self.level.enemies]
+                self.base_surf.blits([p for p in pairs if p], False)
                 # draw player
                 self.player.draw(self.base_surf, cam_x)
 
                 # HUD
                 hud = f"LEVEL {self.level_no}/{self.max_levels}   LIVES {self.player.lives}   COINS {self.player.coins}"
-                hud_surf = self.small_font.render(hud, True, COL_TEXT)
+                hud_surf = self.text(self.small_font, hud, COL_TEXT)
                 self.base_surf.blit(hud_surf, (4, 4))
             elif self.state == "win":
                 msg1 = "YOU WIN!"
                 msg2 = "Press Enter to play again."
-                s1 = self.small_font.render(msg1, True, COL_TEXT)
-                s2 = self.small_font.render(msg2, True, COL_TEXT)
+                s1 = self.text(self.small_font, msg1, COL_TEXT)
+                s2 = self.text(self.small_font, msg2, COL_TEXT)
                 self.base_surf.blit(s1, (BASE_W // 2 - s1.get_width() // 2, BASE_H // 2 - 20))
                 self.base_surf.blit(s2, (BASE_W // 2 - s2.get_width() // 2, BASE_H // 2 + 4))
             elif self.state == "gameover":
                 msg1 = "GAME OVER"
                 msg2 = "Press Enter to restart."
-                s1 = self.small_font.render(msg1, True, COL_TEXT)
-                s2 = self.small_font.render(msg2, True, COL_TEXT)
+                s1 = self.text(self.small_font, msg1, COL_TEXT)
+                s2 = self.text(self.small_font, msg2, COL_TEXT)
                 self.base_surf.blit(s1, (BASE_W // 2 - s1.get_width() // 2, BASE_H // 2 - 20))
                 self.base_surf.blit(s2, (BASE_W // 2 - s2.get_width() // 2, BASE_H // 2 + 4))
 
-            # Scale up to window
-            surface = pygame.transform.scale(self.base_surf, (SCREEN_W, SCREEN_H))
-            self.screen.blit(surface, (0, 0))
+            # Present; the window upscale happens in SDL
+            self.screen.blit(self.base_surf, (0, 0))
             pygame.display.flip()
 
 # --------------------------- Entry Point ----------------------------- #